@@ -8,13 +8,15 @@ import humanize
 from discord.ext import commands
 
 from structure.scare import Scare
-from structure.managers import Context
+from structure.managers import THRESHOLDS, ActionTracker, Context, RestorePipeline
 
 
 class Antinuke(commands.Cog):
     def __init__(self, bot: Scare):
         self.bot = bot
         self.locks = defaultdict(asyncio.Lock)
+        self.tracker = ActionTracker()
+        self.restorer = RestorePipeline(bot)
 
     def dangerous_role(self, target: Union[discord.AuditLogDiff, discord.Role]) -> bool:
         if not hasattr(target, "permissions"):
@@ -85,25 +87,8 @@ class Antinuke(commands.Cog):
 
     @commands.Cog.listener()
     async def on_audit_log_entry_create(self, entry: discord.AuditLogEntry):
-        actions = [
-            "ban",
-            "kick",
-            "role_delete",
-            "role_create",
-            "channel_delete",
-            "channel_create",
-            "webhook_create",
-            "webhook_delete",
-            "sticker_create",
-            "sticker_delete",
-            "emoji_create",
-            "emoji_delete",
-            "member_role_update",
-            "role_update",
-        ]
-
         if (
-            entry.action.name not in actions
+            entry.action.name not in THRESHOLDS
             or not isinstance(entry.user, discord.Member)
             or entry.user_id == self.bot.user.id
             or not entry.user.is_punishable()
@@ -111,28 +96,39 @@ class Antinuke(commands.Cog):
         ):
             return
 
-        result = await self.bot.db.fetchrow(
-            "SELECT * FROM antinuke WHERE guild_id = $1", entry.guild.id
-        )
-        if not result or not (
-            modules := json.loads(result["modules"]).get(entry.action.name)
+        if not (config := self.bot.antinuke.get(entry.guild.id)) or not (
+            module := config.modules.get(entry.action.name)
         ):
             return
 
-        owners, whitelist = result["owners"], result["whitelisted"]
-        if entry.user.id in owners or entry.user.id in whitelist:
+        if entry.user.id in config.owners or entry.user.id in config.whitelisted:
+            return
+
+        if not (
+            targets := self.tracker.hit(
+                entry.guild.id,
+                entry.user.id,
+                entry.action.name,
+                entry.target,
+                config.threshold(entry.action.name),
+            )
+        ):
             return
 
         if entry.action.name.endswith("create"):
-            await entry.target.delete()
+            await asyncio.gather(
+                *(target.delete() for target in targets), return_exceptions=True
+            )
+        elif entry.action.name in ("channel_delete", "role_delete"):
+            self.restorer.spawn(entry.guild, entry.action.name, targets)
 
         async with self.locks[f"{entry.guild.id}-{entry.user.id}"]:
             member = entry.guild.get_member(entry.user.id)
             if not member or not member.is_dangerous():
                 return
 
-            entry.punishment = modules["punishment"]
-            entry.logs = entry.guild.get_channel(result["logs"])
+            entry.punishment = module["punishment"]
+            entry.logs = entry.guild.get_channel(config.logs)
             entry.punished_at = discord.utils.utcnow() - entry.created_at
 
             if not entry.action.name.endswith("update"):
@@ -143,6 +139,20 @@ class Antinuke(commands.Cog):
 
             self.bot.dispatch(entry.action.name, entry=entry)
 
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        if (config := self.bot.antinuke.get(channel.guild.id)) and (
+            "channel_delete" in config.modules
+        ):
+            self.restorer.record_channel(channel)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role):
+        if (config := self.bot.antinuke.get(role.guild.id)) and (
+            "role_delete" in config.modules
+        ):
+            self.restorer.record_role(role)
+
     @commands.Cog.listener()
     async def on_member_role_update(self, entry: discord.AuditLogEntry):
         if hasattr(entry.changes.after, "roles"):
@@ -199,6 +209,7 @@ class Antinuke(commands.Cog):
       """,
             ctx.guild.id,
         )
+        await self.bot.antinuke.refresh(ctx.guild.id)
 
         return await ctx.confirm("Antinuke has been configured succesfully")
 
@@ -212,6 +223,7 @@ class Antinuke(commands.Cog):
         await self.bot.db.execute(
             "DELETE FROM antinuke WHERE guild_id = $1", ctx.guild.id
         )
+        await self.bot.antinuke.refresh(ctx.guild.id)
         return await ctx.confirm("Antinuke has been disabled succesfully")
 
     @antinuke.command(name="logs")
@@ -230,6 +242,7 @@ class Antinuke(commands.Cog):
                     None,
                     ctx.guild.id,
                 )
+                await self.bot.antinuke.refresh(ctx.guild.id)
                 return await ctx.confirm("Removed antinuke logs")
             else:
                 raise commands.ChannelNotFound(channel)
@@ -239,6 +252,7 @@ class Antinuke(commands.Cog):
                 channel.id,
                 ctx.guild.id,
             )
+            await self.bot.antinuke.refresh(ctx.guild.id)
             await ctx.confirm(
                 f"Antinuke log channel was configured succesfully to {channel.mention}"
             )
@@ -320,6 +334,7 @@ class Antinuke(commands.Cog):
         await self.bot.db.execute(
             "UPDATE antinuke SET owners = $1 WHERE guild_id = $2", owners, ctx.guild.id
         )
+        await self.bot.antinuke.refresh(ctx.guild.id)
         return await ctx.confirm(m)
 
     @antinuke.command(name="whitelist")
@@ -352,6 +367,7 @@ class Antinuke(commands.Cog):
             whitelisted,
             ctx.guild.id,
         )
+        await self.bot.antinuke.refresh(ctx.guild.id)
         return await ctx.confirm(m)
 
     @antinuke.command(name="settings")
@@ -428,6 +444,7 @@ class Antinuke(commands.Cog):
             json.dumps(modules),
             ctx.guild.id,
         )
+        await self.bot.antinuke.refresh(ctx.guild.id)
 
         return await ctx.confirm(
             f"Antinuke **{ctx.command.parent.name}** is now enabled - `{punishment}`"
@@ -459,6 +476,7 @@ class Antinuke(commands.Cog):
             json.dumps(modules),
             ctx.guild.id,
         )
+        await self.bot.antinuke.refresh(ctx.guild.id)
 
         return await ctx.confirm(
             f"Antinuke **{ctx.command.parent.name}** is now disabled"
@@ -498,6 +516,7 @@ class Antinuke(commands.Cog):
             json.dumps(modules),
             ctx.guild.id,
         )
+        await self.bot.antinuke.refresh(ctx.guild.id)
 
         return await ctx.confirm(
             f"Antinuke **{ctx.command.parent.name}** is now enabled - `{punishment}`"
@@ -529,6 +548,7 @@ class Antinuke(commands.Cog):
             json.dumps(modules),
             ctx.guild.id,
         )
+        await self.bot.antinuke.refresh(ctx.guild.id)
 
         return await ctx.confirm(
             f"Antinuke **{ctx.command.parent.name}** is now disabled"
@@ -568,6 +588,7 @@ class Antinuke(commands.Cog):
             json.dumps(modules),
             ctx.guild.id,
         )
+        await self.bot.antinuke.refresh(ctx.guild.id)
 
         return await ctx.confirm(
             f"Antinuke **{ctx.command.parent.name}** is now enabled - `{punishment}`"
@@ -599,6 +620,7 @@ class Antinuke(commands.Cog):
             json.dumps(modules),
             ctx.guild.id,
         )
+        await self.bot.antinuke.refresh(ctx.guild.id)
 
         return await ctx.confirm(
             f"Antinuke **{ctx.command.parent.name}** is now disabled"
@@ -646,6 +668,7 @@ class Antinuke(commands.Cog):
             json.dumps(modules),
             ctx.guild.id,
         )
+        await self.bot.antinuke.refresh(ctx.guild.id)
 
     @antinuke_channel.command(name="create")
     @commands.antinuke_owner()
@@ -681,6 +704,7 @@ class Antinuke(commands.Cog):
             json.dumps(modules),
             ctx.guild.id,
         )
+        await self.bot.antinuke.refresh(ctx.guild.id)
 
     @antinuke.group(name="role", invoke_without_command=True)
     async def antinuke_role(self, ctx: Context):
@@ -724,6 +748,7 @@ class Antinuke(commands.Cog):
             json.dumps(modules),
             ctx.guild.id,
         )
+        await self.bot.antinuke.refresh(ctx.guild.id)
 
     @antinuke_role.command(name="edit", aliases=["update"])
     @commands.antinuke_owner()
@@ -761,6 +786,7 @@ class Antinuke(commands.Cog):
             json.dumps(modules),
             ctx.guild.id,
         )
+        await self.bot.antinuke.refresh(ctx.guild.id)
 
     @antinuke_role.command(name="create")
     @commands.antinuke_owner()
@@ -798,6 +824,7 @@ class Antinuke(commands.Cog):
             json.dumps(modules),
             ctx.guild.id,
         )
+        await self.bot.antinuke.refresh(ctx.guild.id)
 
     @antinuke_role.command(name="delete", aliases=["del"])
     @commands.antinuke_owner()
@@ -835,6 +862,7 @@ class Antinuke(commands.Cog):
             json.dumps(modules),
             ctx.guild.id,
         )
+        await self.bot.antinuke.refresh(ctx.guild.id)
 
     @antinuke.group(name="webhook", invoke_without_command=True)
     async def antinuke_webhook(self, ctx: Context):
@@ -882,6 +910,7 @@ class Antinuke(commands.Cog):
             json.dumps(modules),
             ctx.guild.id,
         )
+        await self.bot.antinuke.refresh(ctx.guild.id)
 
     @antinuke_webhook.command(name="create")
     @commands.antinuke_owner()
@@ -921,6 +950,7 @@ class Antinuke(commands.Cog):
             json.dumps(modules),
             ctx.guild.id,
         )
+        await self.bot.antinuke.refresh(ctx.guild.id)
 
     @antinuke.group(name="emoji", aliases=["emojis"], invoke_without_command=True)
     async def antinuke_emoji(self: "Antinuke", ctx: Context):
@@ -966,6 +996,7 @@ class Antinuke(commands.Cog):
             json.dumps(modules),
             ctx.guild.id,
         )
+        await self.bot.antinuke.refresh(ctx.guild.id)
 
     @antinuke_emoji.command(name="delete")
     @commands.antinuke_owner()
@@ -1003,6 +1034,7 @@ class Antinuke(commands.Cog):
             json.dumps(modules),
             ctx.guild.id,
         )
+        await self.bot.antinuke.refresh(ctx.guild.id)
 
     @antinuke.group(name="sticker", aliases=["stickers"], invoke_without_command=True)
     async def antinuke_sticker(self, ctx: Context):
@@ -44,7 +44,7 @@ from discord.ext.commands import (
 from discord.ui import Button, View
 
 from structure.scare import Scare, ratelimiter
-from structure.managers import Context
+from structure.managers import Context, JoinEvent, SpamDetector
 from structure.utilities import (
     AssignableRole,
     Color,
@@ -75,12 +75,7 @@ class Configuration(Cog):
         self.link_regex = r"(http|ftp|https):\/\/([\w_-]+(?:(?:\.[\w_-]+)+))([\w.,@?^=%&:\/~+#-]*[\w@?^=%&\/~+#-])"
         self.hex_regex = re.compile("^#([A-Fa-f0-9]{6}|[A-Fa-f0-9]{3})$")
         self.whitelist_cache = {}
-        self.antispam_cache = {}
-
-    async def remove_element(self, user_id, guild_id, element):
-        await asyncio.sleep(1)
-        if element in self.antispam_cache[f"{user_id}-{guild_id}"]:
-            self.antispam_cache[f"{user_id}-{guild_id}"].remove(element)
+        self.antispam = SpamDetector()
 
     async def transcribe(self, attachment: Attachment):
         r = sr.Recognizer()
@@ -135,57 +130,36 @@ class Configuration(Cog):
 
     @Cog.listener()
     async def on_raw_reaction_remove(self, payload: RawReactionActionEvent):
+        if payload.message_id not in self.bot.reactionroles.messages:
+            return
+
         if guild := self.bot.get_guild(payload.guild_id):
-            if role_id := await self.bot.db.fetchval(
-                """
-                SELECT role_id FROM reactionroles
-                WHERE guild_id = $1 AND
-                channel_id = $2 AND message_id = $3
-                AND emoji = $4   
-                """,
-                payload.guild_id,
-                payload.channel_id,
-                payload.message_id,
-                str(payload.emoji),
+            if role_id := self.bot.reactionroles.get(
+                payload.message_id, str(payload.emoji)
             ):
-                async with self.locks[guild.id]:
-                    if role := guild.get_role(role_id):
-                        if member := guild.get_member(payload.user_id):
-                            if not member.bot:
-                                if role in member.roles:
-                                    await member.remove_roles(
-                                        role, reason="Reactionrole"
-                                    )
+                self.bot.reactionroles.enqueue(
+                    guild.id, payload.user_id, role_id, add=False
+                )
 
     @Cog.listener()
     async def on_raw_reaction_add(self, payload: RawReactionActionEvent):
+        if payload.message_id not in self.bot.reactionroles.messages:
+            return
+
         if guild := self.bot.get_guild(payload.guild_id):
-            if role_id := await self.bot.db.fetchval(
-                """
-                SELECT role_id FROM reactionroles
-                WHERE guild_id = $1 AND
-                channel_id = $2 AND message_id = $3
-                AND emoji = $4   
-                """,
-                payload.guild_id,
-                payload.channel_id,
-                payload.message_id,
-                str(payload.emoji),
+            if role_id := self.bot.reactionroles.get(
+                payload.message_id, str(payload.emoji)
             ):
-                async with self.locks[guild.id]:
-                    if role := guild.get_role(role_id):
-                        if member := guild.get_member(payload.user_id):
-                            if not member.bot:
-                                if not role in member.roles:
-                                    await member.add_roles(role, reason="Reactionrole")
+                self.bot.reactionroles.enqueue(
+                    guild.id, payload.user_id, role_id, add=True
+                )
 
     @Cog.listener("on_message")
     async def on_settings(self, message: Message):
         if not message.author.bot:
             if message.guild:
-                if settings := await self.bot.db.fetchrow(
-                    "SELECT * FROM server_settings WHERE guild_id = $1",
-                    message.guild.id,
+                if settings := self.bot.settings.get(
+                    "server_settings", message.guild.id
                 ):
                     if settings.heximage:
                         if match := re.search(self.hex_regex, message.content):
@@ -251,97 +225,82 @@ class Configuration(Cog):
                     not message.author.guild_permissions.administrator
                     and not message.author.bot
                 ):
-                    if result := await self.bot.db.fetchrow(
-                        "SELECT * FROM antispam WHERE guild_id = $1", message.guild.id
-                    ):
+                    if result := self.bot.settings.get("antispam", message.guild.id):
                         if not message.author.id in result.whitelisted:
-                            async with self.locks[message.guild.id]:
-                                if not message.author.is_timed_out():
-                                    if m := message.content.split("\n"):
-                                        if len(m) > 5:
-                                            avg = sum(len(g) for g in m) / len(m)
-                                            if avg < 10:
-                                                await message.delete()
-                                                await message.author.timeout(
-                                                    datetime.timedelta(
-                                                        seconds=result.duration
-                                                    ),
-                                                    reason="Timed out for ladder typing",
-                                                )
+                            if message.author.is_timed_out():
+                                return
+
+                            if m := message.content.split("\n"):
+                                if len(m) > 5:
+                                    avg = sum(len(g) for g in m) / len(m)
+                                    if avg < 10:
+                                        state = self.antispam.state(
+                                            message.guild.id, message.author.id
+                                        )
+                                        async with state.lock:
+                                            if message.author.is_timed_out():
+                                                return
+
+                                            await message.delete()
+                                            await message.author.timeout(
+                                                datetime.timedelta(
+                                                    seconds=result.duration
+                                                ),
+                                                reason="Timed out for ladder typing",
+                                            )
 
-                                                embed = discord.Embed(
-                                                    color=discord.Color.yellow(),
-                                                    title="Ladder typing",
-                                                    description=f"{message.author.mention} has been muted for **{humanfriendly.format_timespan(result.duration)}**",
-                                                )
+                                        embed = discord.Embed(
+                                            color=discord.Color.yellow(),
+                                            title="Ladder typing",
+                                            description=f"{message.author.mention} has been muted for **{humanfriendly.format_timespan(result.duration)}**",
+                                        )
 
-                                                return await message.channel.send(
-                                                    embed=embed
-                                                )
+                                        return await message.channel.send(embed=embed)
 
-                                    if not self.antispam_cache.get(
-                                        f"{message.author.id}-{message.guild.id}"
-                                    ):
-                                        self.antispam_cache[
-                                            f"{message.author.id}-{message.guild.id}"
-                                        ] = []
-
-                                    self.antispam_cache[
-                                        f"{message.author.id}-{message.guild.id}"
-                                    ].append(message)
-                                    asyncio.ensure_future(
-                                        self.remove_element(
-                                            message.author.id, message.guild.id, message
-                                        )
+                            if message_ids := self.antispam.hit(
+                                message.guild.id, message.author.id, message.id
+                            ):
+                                state = self.antispam.state(
+                                    message.guild.id, message.author.id
+                                )
+                                async with state.lock:
+                                    if message.author.is_timed_out():
+                                        return
+
+                                    await message.author.timeout(
+                                        datetime.timedelta(seconds=result.duration),
+                                        reason="Timed out for spamming",
                                     )
 
-                                    if (
-                                        len(
-                                            self.antispam_cache[
-                                                f"{message.author.id}-{message.guild.id}"
-                                            ]
-                                        )
-                                        == 4
-                                    ):
-                                        await message.author.timeout(
-                                            datetime.timedelta(seconds=result.duration),
-                                            reason="Timed out for spamming",
-                                        )
+                                embed = discord.Embed(
+                                    color=discord.Color.yellow(),
+                                    title="Antispam",
+                                    description=f">>> {message.author.mention} has been muted for **{humanfriendly.format_timespan(result.duration)}**",
+                                )
 
-                                        embed = discord.Embed(
-                                            color=discord.Color.yellow(),
-                                            title="Antispam",
-                                            description=f">>> {message.author.mention} has been muted for **{humanfriendly.format_timespan(result.duration)}**",
-                                        )
+                                await message.channel.send(embed=embed)
+                                await message.channel.delete_messages(
+                                    [discord.Object(id=i) for i in message_ids]
+                                )
 
-                                        await message.channel.send(embed=embed)
-                                        await message.channel.delete_messages(
-                                            self.antispam_cache[
-                                                f"{message.author.id}-{message.guild.id}"
-                                            ]
-                                        )
-                                        del self.antispam_cache[
-                                            f"{message.author.id}-{message.guild.id}"
-                                        ]
+    @Cog.listener("on_join_pipeline")
+    async def whitelist_protect(self: "Configuration", event: JoinEvent):
+        member, settings = event.member, event.settings
 
-    @Cog.listener("on_member_join")
-    async def whitelist_protect(self: "Configuration", member: Member):
-        result = await self.bot.db.fetchrow(
-            "SELECT * FROM whitelist WHERE guild_id = $1", member.guild.id
-        )
-        if result:
+        if settings.whitelisted is not None:
             if not self.whitelist_cache.get(member.guild.id):
                 self.whitelist_cache[member.guild.id] = {}
 
-            if not member.id in result.whitelisted:
+            if not member.id in settings.whitelisted:
                 async with self.locks[member.guild.id]:
                     c = self.whitelist_cache[member.guild.id].get(member.id, 0)
                     self.whitelist_cache[member.guild.id][member.id] = c + 1
 
-                    try:
-                        await member.send(result.msg)
-                    except:
-                        pass
+                    if not event.raid:
+                        try:
+                            await member.send(settings.whitelist_msg)
+                        except:
+                            pass
 
                     if self.whitelist_cache[member.guild.id][member.id] == 3:
                         del self.whitelist_cache[member.guild.id][member.id]
@@ -351,11 +310,11 @@ class Configuration(Cog):
                     else:
                         await member.kick(reason="Unwhitelisted member")
 
-    @Cog.listener("on_member_join")
-    async def on_autorole_receive(self: "Configuration", member: Member):
-        if roles := await self.bot.db.fetchval(
-            "SELECT roles FROM autorole WHERE guild_id = $1", member.guild.id
-        ):
+    @Cog.listener("on_join_pipeline")
+    async def on_autorole_receive(self: "Configuration", event: JoinEvent):
+        member = event.member
+
+        if not event.rejected and (roles := event.settings.autoroles):
             roles = list(
                 filter(
                     lambda r: r and r.is_assignable(),
@@ -399,40 +358,16 @@ class Configuration(Cog):
     async def on_user_update(self, before: User, after: User):
         if not before.bot:
             if str(before) != str(after):
-                channel_ids = list(
-                    map(
-                        lambda c: c["channel_id"],
-                        await self.bot.db.fetch(
-                            "SELECT channel_id FROM tracker.username"
-                        ),
-                    )
-                )
-
-                for channel_id in channel_ids:
-                    if channel := self.bot.get_channel(channel_id):
-                        await asyncio.sleep(0.1)
-                        await channel.send(f"Username available: **{before}**")
+                self.bot.tracker.publish("username", f"Username available: **{before}**")
 
     @Cog.listener()
     async def on_guild_update(self, before: Guild, after: Guild):
         if before.vanity_url_code:
             if before.vanity_url_code != after.vanity_url_code:
-                channel_ids = list(
-                    map(
-                        lambda c: c["channel_id"],
-                        await self.bot.db.fetch(
-                            "SELECT channel_id FROM tracker.vanity"
-                        ),
-                    )
+                self.bot.tracker.publish(
+                    "vanity", f"Vanity URL available: **/{before.vanity_url_code}**"
                 )
 
-                for channel_id in channel_ids:
-                    if channel := self.bot.get_channel(channel_id):
-                        await asyncio.sleep(0.1)
-                        await channel.send(
-                            f"Vanity URL available: **/{before.vanity_url_code}**"
-                        )
-
     @group(aliases=["gw"], invoke_without_command=True)
     async def giveaway(self, ctx: Context):
         """
@@ -852,6 +787,7 @@ class Configuration(Cog):
                         "There's no vanity tracker channel in your server"
                     )
 
+                self.bot.tracker.unsubscribe("vanity", ctx.guild.id)
                 return await ctx.confirm("Stopped tracking vanities")
             else:
                 raise ChannelNotFound(channel)
@@ -865,6 +801,7 @@ class Configuration(Cog):
                 ctx.guild.id,
                 channel.id,
             )
+            self.bot.tracker.subscribe("vanity", ctx.guild.id, channel.id)
 
             return await ctx.confirm(f"Tracking vanity updates in {channel.mention}")
 
@@ -886,6 +823,7 @@ class Configuration(Cog):
                         "There's no username tracker channel in your server"
                     )
 
+                self.bot.tracker.unsubscribe("username", ctx.guild.id)
                 return await ctx.confirm("Stopped tracking usernames")
             else:
                 raise ChannelNotFound(channel)
@@ -899,6 +837,7 @@ class Configuration(Cog):
                 ctx.guild.id,
                 channel.id,
             )
+            self.bot.tracker.subscribe("username", ctx.guild.id, channel.id)
 
             return await ctx.confirm(f"Tracking username updates in {channel.mention}")
 
@@ -931,6 +870,8 @@ class Configuration(Cog):
         if r == "DELETE 0":
             return await ctx.alert("This command was **not** disabled")
 
+        self.bot.settings.enable_command(ctx.guild.id, command)
+
         return await ctx.confirm(f"Enabled **{command}**")
 
     @settings.command(name="disablecommand", aliases=["disablecmd"])
@@ -959,6 +900,8 @@ class Configuration(Cog):
         if r == "INSERT 0":
             return await ctx.alert(f"**{command}** is **already** disabled")
 
+        self.bot.settings.disable_command(ctx.guild.id, command)
+
         return await ctx.confirm(f"Disabled **{command}**")
 
     @settings.command(name="heximage")
@@ -978,6 +921,7 @@ class Configuration(Cog):
             ctx.guild.id,
             bool(value == "enable"),
         )
+        await self.bot.settings.refresh("server_settings", ctx.guild.id)
 
         if r.endswith("0"):
             return await ctx.alert(f"Heximage is **already** {value}d")
@@ -1003,6 +947,7 @@ class Configuration(Cog):
             ctx.guild.id,
             bool(value == "enable"),
         )
+        await self.bot.settings.refresh("server_settings", ctx.guild.id)
 
         if r.endswith("0"):
             return await ctx.alert(f"Voice transcriptions are **already** {value}d")
@@ -1047,6 +992,7 @@ class Configuration(Cog):
             ctx.guild.id,
             roles,
         )
+        await self.bot.joins.refresh(ctx.guild.id)
 
         return await ctx.confirm(f"Added {role.mention} as an autorole")
 
@@ -1080,6 +1026,7 @@ class Configuration(Cog):
             ctx.guild.id,
             roles,
         )
+        await self.bot.joins.refresh(ctx.guild.id)
 
         return await ctx.confirm(f"Removed {role.mention} from the autoroles")
 
@@ -1133,6 +1080,7 @@ class Configuration(Cog):
                 whitelisted,
                 ctx.guild.id,
             )
+            await self.bot.joins.refresh(ctx.guild.id)
 
     @whitelist.command(name="dm", aliases=["message", "msg"])
     @antinuke_owner()
@@ -1144,6 +1092,7 @@ class Configuration(Cog):
         r = await self.bot.db.execute(
             "UPDATE whitelist SET msg = $1 WHERE guild_id = $2", message, ctx.guild.id
         )
+        await self.bot.joins.refresh(ctx.guild.id)
 
         if r == "UPDATE 0":
             return await ctx.alert(
@@ -1165,6 +1114,7 @@ class Configuration(Cog):
             await self.bot.db.execute(
                 "INSERT INTO whitelist (guild_id) VALUES ($1)", ctx.guild.id
             )
+            await self.bot.joins.refresh(ctx.guild.id)
             return await ctx.confirm(
                 "Whitelist feature was enable. Any non whitelisted member will be kicked on join"
             )
@@ -1172,6 +1122,7 @@ class Configuration(Cog):
             await self.bot.db.execute(
                 "DELETE FROM whitelist WHERE guild_id = $1", ctx.guild.id
             )
+            await self.bot.joins.refresh(ctx.guild.id)
             return await ctx.confirm("Whitelist feature was disabled")
 
     @group(invoke_without_command=True)
@@ -1198,6 +1149,7 @@ class Configuration(Cog):
             ctx.guild.id,
             seconds,
         )
+        await self.bot.settings.refresh("antispam", ctx.guild.id)
 
         if r == "INSERT 0":
             return await ctx.alert("The antispam was **already** enabled")
@@ -1216,6 +1168,7 @@ class Configuration(Cog):
         r = await self.bot.db.execute(
             "DELETE FROM antispam WHERE guild_id = $1", ctx.guild.id
         )
+        await self.bot.settings.refresh("antispam", ctx.guild.id)
 
         if r == "DELETE 0":
             return await ctx.alert("The antispam is **not** enabled in this server")
@@ -1237,6 +1190,7 @@ class Configuration(Cog):
         await self.bot.db.execute(
             "UPDATE antispam SET duration = $1 WHERE guild_id = $2", time, ctx.guild.id
         )
+        await self.bot.settings.refresh("antispam", ctx.guild.id)
         return await ctx.confirm(
             f"The antispam mute duration has been updated to **{humanfriendly.format_timespan(time)}**"
         )
@@ -1271,6 +1225,7 @@ class Configuration(Cog):
             whitelisted,
             ctx.guild.id,
         )
+        await self.bot.settings.refresh("antispam", ctx.guild.id)
 
         return await ctx.confirm(f"Whitelisted {member.mention} from the antispam")
 
@@ -1301,6 +1256,7 @@ class Configuration(Cog):
             whitelisted,
             ctx.guild.id,
         )
+        await self.bot.settings.refresh("antispam", ctx.guild.id)
 
         return await ctx.confirm(f"Unwhitelisted {member.mention} from the antispam")
 
@@ -2017,6 +1973,7 @@ class Configuration(Cog):
             ctx.guild.id,
             role.id,
         )
+        self.bot.settings.set_fake_permissions(ctx.guild.id, role.id, permissions)
         return await ctx.confirm(
             f"Removed `{permission}` from {role.mention}'s permissions"
         )
@@ -2057,6 +2014,7 @@ class Configuration(Cog):
             role.id,
             permissions,
         )
+        self.bot.settings.set_fake_permissions(ctx.guild.id, role.id, permissions)
 
         return await ctx.confirm(
             f"Added `{permission}` to the {role.mention}'s fake permissions"
@@ -2591,6 +2549,7 @@ class Configuration(Cog):
             ctx.guild.id,
             message.id,
         )
+        self.bot.reactionroles.clear(message.id)
 
         if r == "DELETE 0":
             return await ctx.alert(
@@ -2622,6 +2581,7 @@ class Configuration(Cog):
             str(emoji),
             ctx.guild.id,
         )
+        self.bot.reactionroles.remove(message.id, str(emoji))
 
         if r == "DELETE 0":
             return await ctx.alert(
@@ -2665,6 +2625,7 @@ class Configuration(Cog):
             message.channel.id,
             role.id,
         )
+        self.bot.reactionroles.add(message.id, str(emoji), role.id)
 
         if r.startswith("INSERT"):
             await message.add_reaction(emoji)
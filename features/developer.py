@@ -34,7 +34,7 @@ from discord.utils import format_dt, utcnow
 from jishaku.codeblocks import codeblock_converter
 
 from structure.scare import Scare
-from structure.managers import Context, getLogger
+from structure.managers import Context, JoinEvent, getLogger
 
 logger = getLogger(__name__)
 
@@ -73,14 +73,13 @@ class Developer(Cog):
 
         return False
 
-    @Cog.listener()
-    async def on_member_join(self, member: Member):
-        reason = await self.bot.db.fetchval(
-            "SELECT reason FROM globalban WHERE user_id = $1", member.id
-        )
-        if reason:
+    @Cog.listener("on_join_pipeline")
+    async def on_globalbanned_join(self, event: JoinEvent):
+        member = event.member
+
+        if member.id in self.bot.joins.globalbans:
             if member.guild.me.guild_permissions.ban_members:
-                await member.ban(reason=reason)
+                await member.ban(reason=self.bot.joins.globalbans[member.id])
 
     @Cog.listener("on_message")
     async def wave(self, message: discord.Message):
@@ -325,6 +324,7 @@ class Developer(Cog):
             await self.bot.db.execute(
                 "DELETE FROM globalban WHERE user_id = $1", user.id
             )
+            self.bot.joins.globalbans.pop(user.id, None)
             return await ctx.confirm(
                 f"{user.mention} was succesfully globally unbanned"
             )
@@ -341,6 +341,7 @@ class Developer(Cog):
         await self.bot.db.execute(
             "INSERT INTO globalban VALUES ($1,$2)", user.id, reason
         )
+        self.bot.joins.globalbans[user.id] = reason
         return await ctx.confirm(
             f"{user.mention} was succesfully globally banned in {len(tasks)}/{mutual_guilds} servers"
         )
@@ -717,12 +718,11 @@ class Developer(Cog):
         Blacklist/Unblacklist a guild
         """
 
-        if await self.bot.db.fetchrow(
-            "SELECT * FROM blacklist WHERE target_id = $1", guild_id
-        ):
+        if guild_id in self.bot.blacklisted:
             await self.bot.db.execute(
                 "DELETE FROM blacklist WHERE target_id = $1", guild_id
             )
+            self.bot.blacklisted.pop(guild_id, None)
             return await ctx.confirm(f"Unblacklisted `{guild_id}`!")
         else:
             await self.bot.db.execute(
@@ -732,6 +732,7 @@ class Developer(Cog):
                 ctx.author.id,
                 format_dt(datetime.datetime.now(), style="R"),
             )
+            self.bot.blacklisted[guild_id] = "guild"
 
             if guild := self.bot.get_guild(guild_id):
                 await guild.leave()
@@ -753,12 +754,12 @@ class Developer(Cog):
             await self.bot.db.execute(
                 "DELETE FROM blacklist WHERE target_id = $1", user.id
             )
-            self.bot.blacklisted.remove(user.id)
+            self.bot.blacklisted.pop(user.id, None)
             return await ctx.confirm(
                 f"Unblacklisted **{user}**. Now they can use **{self.bot.user.name}**"
             )
         else:
-            self.bot.blacklisted.append(user.id)
+            self.bot.blacklisted[user.id] = "user"
             await self.bot.db.execute(
                 "INSERT INTO blacklist VALUES ($1,$2,$3,$4)",
                 user.id,
@@ -22,14 +22,19 @@ from structure.utilities import ChartSize, FMHandler, Playing, plural
 class LastFM(Cog):
     def __init__(self, bot: Scare):
         self.bot: Scare = bot
-        self.handler = FMHandler()
+        self.handler = FMHandler(bot.db)
         self.locks = defaultdict(asyncio.Lock)
 
+    async def cog_load(self):
+        # fonts and the thumbnail index are read once, not on every collage
+        await self.handler.renderer.load()
+
+    async def cog_unload(self):
+        await self.handler.renderer.close()
+
     @Cog.listener()
     async def on_message(self, message: Message):
-        if cmd := await self.bot.db.fetchval(
-            "SELECT command FROM lastfm.user WHERE user_id = $1", message.author.id
-        ):
+        if cmd := self.bot.settings.lastfm_commands.get(message.author.id):
             if message.content == cmd:
                 if not ratelimiter(
                     bucket=f"lf-{message.channel.id}", key="lf", rate=3, per=2
@@ -153,6 +158,7 @@ class LastFM(Cog):
             """,
             ctx.author.id,
         )
+        await self.bot.settings.refresh_lastfm(ctx.author.id)
         if result == "DELETE 0":
             return await ctx.alert(
                 f"Your LastFM isn't connected with {self.bot.user.name}!"
@@ -339,7 +345,7 @@ class LastFM(Cog):
                 results = await self.bot.db.fetch(
                     f"SELECT user_id, username FROM lastfm.user WHERE user_id IN ({friends})"
                 )
-                whoknows = await self.handler.whoknows(artist, results)
+                whoknows, _ = await self.handler.whoknows(artist, results)
 
                 return await ctx.paginate(
                     [
@@ -378,13 +384,14 @@ class LastFM(Cog):
                 results = await self.bot.db.fetch(
                     "SELECT user_id, username FROM lastfm.user"
                 )
+                listeners, complete = await self.handler.whoknows(artist, results)
                 whoknows = list(
-                    filter(
-                        lambda r: self.bot.get_user(r.user_id),
-                        await self.handler.whoknows(artist, results),
-                    )
+                    filter(lambda r: self.bot.get_user(r.user_id), listeners)
                 )
 
+                if not whoknows:
+                    return await ctx.alert(f"Nobody has listened to **{artist}**")
+
                 ids = list(map(lambda r: r.user_id, whoknows))
 
                 try:
@@ -406,17 +413,8 @@ class LastFM(Cog):
                     )
                 ]
 
-                r = await self.bot.db.execute(
-                    """
-                    INSERT INTO lastfm.crowns VALUES ($1,$2)
-                    ON CONFLICT (artist) DO UPDATE SET
-                    user_id = $2
-                    """,
-                    artist.lower(),
-                    whoknows[0].user_id,
-                )
-
-                if r.endswith("1"):
+                # a crown from a partial listing could go to the wrong listener
+                if complete and await self.handler.crown(artist, whoknows):
                     embeds.append(
                         Embed(
                             description=f"> 👑 **{self.bot.get_user(whoknows[0].user_id)}** has claimed the crown for **{artist.lower()}**"
@@ -452,7 +450,7 @@ class LastFM(Cog):
                 results = await self.bot.db.fetch(
                     f"SELECT user_id, username FROM lastfm.user WHERE user_id IN {members}"
                 )
-                whoknows = await self.handler.whoknows(artist, results)
+                whoknows, _ = await self.handler.whoknows(artist, results)
 
                 return await ctx.paginate(
                     [
@@ -601,6 +599,7 @@ class LastFM(Cog):
         r = await self.bot.db.execute(
             "UPDATE lastfm.user SET command = $1 WHERE user_id = $2", cmd, ctx.author.id
         )
+        await self.bot.settings.refresh_lastfm(ctx.author.id)
 
         if r == "UPDATE 0":
             return await ctx.alert("You don't have a LastFM user set")
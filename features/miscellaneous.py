@@ -49,7 +49,7 @@ from pytz import timezone
 from shazamio import Shazam
 
 from structure.scare import Afk, Scare, ratelimiter
-from structure.managers import Context
+from structure.managers import Context, EditSnipe, ReactionSnipe, Snipe
 from structure.utilities import CashApp, Location
 from structure.utilities import Member as AssignableMember
 from structure.utilities import (
@@ -61,6 +61,7 @@ from structure.utilities import (
     Tiktok,
     TikTokUser,
     ValidDate,
+    VARIABLES,
     Weather,
     WeatherModel,
     plural,
@@ -158,27 +159,24 @@ class Miscellaneous(Cog):
     ):
         if not user.bot: 
             if message := reaction.message:
-                await self.bot.cache.append(
-                    f"reaction-{message.channel.id}", {
-                        'reaction': reaction,
-                        'user': user,
-                        'reacted': datetime.datetime.now()
-                    },
-                    3600*2
+                self.bot.snipes.push(
+                    "reaction",
+                    message.channel.id,
+                    ReactionSnipe.from_reaction(reaction, user),
                 )
 
     @Cog.listener()
     async def on_message_delete(self: "Miscellaneous", message: Message):
         if not message.author.bot:
-            await self.bot.cache.append(
-                f"snipe-{message.channel.id}", message, 3600 * 2
+            self.bot.snipes.push(
+                "snipe", message.channel.id, Snipe.from_message(message)
             )
 
     @Cog.listener()
     async def on_message_edit(self: "Miscellaneous", before: Message, after: Message):
         if not before.author.bot:
-            await self.bot.cache.append(
-                f"editsnipe-{before.channel.id}", (before, after), 3600 * 2
+            self.bot.snipes.push(
+                "editsnipe", before.channel.id, EditSnipe.from_messages(before, after)
             )
 
     @Cog.listener("on_user_update")
@@ -382,6 +380,7 @@ class Miscellaneous(Cog):
         Get the top 10 most used commands of scare
         """
 
+        await self.bot.usage.flush()
         results = await self.bot.db.fetch(
             """
             SELECT * FROM topcmds
@@ -973,17 +972,12 @@ class Miscellaneous(Cog):
         Get the available embed variables
         """
 
-        models = self.bot.embed.init_models(ctx.author)
         return await ctx.paginate(
-            self.bot.flatten(
-                [
-                    [
-                        "{" + f"{k}.{i}" + "}"
-                        for i in json.loads(v.schema_json())["properties"].keys()
-                    ]
-                    for k, v in models.items()
-                ]
-            ),
+            [
+                "{" + f"{model}.{variable}" + "}"
+                for model, variables in VARIABLES.items()
+                for variable in variables
+            ],
             Embed(title="Embed Variables"),
         )
 
@@ -1680,24 +1674,23 @@ class Miscellaneous(Cog):
         Snipe a recently edited message
         """
 
-        messages = self.bot.cache.get(f"editsnipe-{ctx.channel.id}")
+        if not (messages := self.bot.snipes.get("editsnipe", ctx.channel.id)):
+            return await ctx.alert("There are no sniped messages in this channel")
 
         try:
-            before, after = messages[::-1][index - 1]
+            message: EditSnipe = messages[::-1][index - 1]
         except IndexError:
             return await ctx.alert("That is out of my range!")
-        except TypeError:
-            return await ctx.alert("There are no sniped messages in this channel")
 
         now = datetime.datetime.now(tz=datetime.timezone.utc)
-        seconds = (now - after.edited_at).total_seconds()
+        seconds = (now - message.timestamp).total_seconds()
         edited = humanize.naturaltime(now - datetime.timedelta(seconds=seconds))
 
         embed = Embed()
         embed.set_author(
-            name=after.author.name, icon_url=after.author.display_avatar.url
-        ).add_field(name="Before", value=before.content).add_field(
-            name="After", value=after.content
+            name=message.author_name, icon_url=message.avatar_url
+        ).add_field(name="Before", value=message.before).add_field(
+            name="After", value=message.content
         ).set_footer(
             text=f"Edited {edited} \u2022 {index:,}/{len(messages)} messages",
         )
@@ -1710,18 +1703,17 @@ class Miscellaneous(Cog):
         Snipe a recently removed reaction
         """
 
-        reactions = self.bot.cache.get(f"reaction-{ctx.channel.id}")
-        
+        if not (reactions := self.bot.snipes.get("reaction", ctx.channel.id)):
+            return await ctx.alert("There are no sniped reactions in this channel")
+
         try:
-            reaction, user, reacted = reactions[::-1][index-1].values()
+            reaction: ReactionSnipe = reactions[::-1][index - 1]
         except IndexError:
             return await ctx.alert("That is out of my range!")
-        except TypeError:
-            return await ctx.alert("There are no sniped reactions in this channel")
-        
+
         await ctx.neutral(
-            f"{user.mention} removed {reaction.emoji} from {reaction.message.jump_url} {format_dt(reacted, style='R')}"
-        ) 
+            f"{reaction.mention} removed {reaction.emoji} from {reaction.jump_url} {format_dt(reaction.timestamp, style='R')}"
+        )
 
     @hybrid_command(name="snipe", aliases=["s"])
     async def snipe(self: "Miscellaneous", ctx: Context, index: int = 1) -> Message:
@@ -1729,17 +1721,16 @@ class Miscellaneous(Cog):
         Snipe a recently deleted message
         """
 
-        messages = self.bot.cache.get(f"snipe-{ctx.channel.id}")
+        if not (messages := self.bot.snipes.get("snipe", ctx.channel.id)):
+            return await ctx.alert("There are no sniped messages in this channel")
 
         try:
-            message: discord.Message = messages[::-1][index - 1]
+            message: Snipe = messages[::-1][index - 1]
         except IndexError:
             return await ctx.alert("That is out of my range!")
-        except TypeError:
-            return await ctx.alert("There are no sniped messages in this channel")
 
         now = datetime.datetime.now(tz=datetime.timezone.utc)
-        seconds = (now - message.created_at).total_seconds()
+        seconds = (now - message.timestamp).total_seconds()
         deleted = humanize.naturaltime(now - datetime.timedelta(seconds=seconds))
 
         if re.search(self.bot.invite_regex, message.content):
@@ -1755,33 +1746,25 @@ class Miscellaneous(Cog):
                     mes if mes != "" else "Message has embed or attachment only!!"
                 )
             )
-            .set_author(
-                name=message.author.name, icon_url=message.author.display_avatar.url
-            )
+            .set_author(name=message.author_name, icon_url=message.avatar_url)
             .set_footer(
                 text=f"Deleted {deleted} \u2022 {index:,}/{len(messages)} messages",
             )
         )
 
-        if message.attachments:
-            attachment = message.attachments[0]
-            if attachment.content_type:
-                if attachment.content_type.startswith("image"):
-                    embed.set_image(url=attachment.url)
-                else:
-                    file = discord.File(
-                        BytesIO(await attachment.read()), filename=attachment.filename
-                    )
-                    return await ctx.send(embed=embed, file=file)
-
-        elif message.stickers:
-            embed.set_image(url=message.stickers[0].url)
+        if attachment := next(iter(message.attachments), None):
+            content_type = next(iter(message.content_types), None) or ""
+            if content_type.startswith("image/") or (
+                attachment.split("?")[0]
+                .lower()
+                .endswith(("png", "jpg", "jpeg", "gif", "webp"))
+            ):
+                embed.set_image(url=attachment)
+            else:
+                embed.add_field(name="Attachment", value=f"[**view**]({attachment})")
 
         return await ctx.send(
-            embeds=[
-                embed,
-                *[embed for embed in message.embeds[:-1]],
-            ],
+            embeds=[embed, *(Embed.from_dict(data) for data in message.embeds)]
         )
 
     @hybrid_command(name="clearsnipes", aliases=["cs"])
@@ -1791,8 +1774,8 @@ class Miscellaneous(Cog):
         Clear the snipe cache
         """
 
-        self.bot.cache.remove(f"snipe-{ctx.channel.id}")
-        self.bot.cache.remove(f"editsnipe-{ctx.channel.id}")
+        self.bot.snipes.clear("snipe", ctx.channel.id)
+        self.bot.snipes.clear("editsnipe", ctx.channel.id)
         return await ctx.message.add_reaction("👍")
 
     @command(
@@ -2025,7 +2008,7 @@ class Miscellaneous(Cog):
             prefix,
         )
 
-        self.bot.prefixes[ctx.guild.id] = prefix
+        self.bot.set_prefix(ctx.guild.id, prefix)
         await ctx.confirm(f"Updated the server's prefix to `{prefix}`")
 
     @group(aliases=["bday"], invoke_without_command=True)
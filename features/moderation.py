@@ -32,7 +32,7 @@ from discord.ui import Button, View, button
 from discord.utils import utcnow
 
 from structure.scare import Scare
-from structure.managers import Context
+from structure.managers import Context, JoinEvent
 from structure.utilities import AssignableRole, Channel
 from structure.utilities import Color as ValidColor
 from structure.utilities import DiscordEmoji, Member, Time
@@ -128,18 +128,15 @@ class Moderation(Cog):
                 list(map(lambda r: r.id, before.roles)),
             )
 
-    @Cog.listener()
-    async def on_member_join(self, member: DefaultMember):
-        if await self.bot.db.fetchrow(
-            "SELECT * FROM jail WHERE user_id = $1 AND guild_id = $2",
-            member.id,
-            member.guild.id,
-        ):
-            if role_id := self.bot.db.fetchval(
-                "SELECT role_id FROM moderation WHERE guild_id = $1", member.guild.id
-            ):
-                if role := member.guild.get_role(role_id):
-                    await member.add_roles(role, reason="Jailed member")
+    @Cog.listener("on_join_pipeline")
+    async def on_jailed_join(self, event: JoinEvent):
+        member = event.member
+
+        if event.rejected or not self.bot.joins.is_jailed(member.guild.id, member.id):
+            return
+
+        if role := member.guild.get_role(event.settings.jail_role):
+            await member.add_roles(role, reason="Jailed member")
 
     @Cog.listener()
     async def on_member_remove(self, member: DefaultMember):
@@ -960,6 +957,7 @@ class Moderation(Cog):
             await self.bot.db.execute(
                 "UPDATE welcome SET channel_id = $1 WHERE channel_id = $2", *args
             )
+            await self.bot.joins.refresh(interaction.guild.id)
             await self.bot.db.execute(
                 "UPDATE goodbye SET channel_id = $1 WHERE channel_id = $2", *args
             )
@@ -1270,6 +1268,7 @@ class Moderation(Cog):
             channel.id,
             category.id,
         )
+        await self.bot.joins.refresh(ctx.guild.id)
 
         return await ctx.send("👍")
 
@@ -1288,6 +1287,8 @@ class Moderation(Cog):
             """,
             ctx.guild.id,
         ):
+            await self.bot.joins.refresh(ctx.guild.id)
+
             for channel in (
                 channel
                 for channel_id in channel_ids
@@ -1337,6 +1338,8 @@ class Moderation(Cog):
             if r == "INSERT 0":
                 return await ctx.alert("This member is **already** jailed")
 
+            self.bot.joins.jail(ctx.guild.id, member.id)
+
             roles = [r for r in member.roles if not r in member.roles]
             roles.append(role)
             await member.edit(roles=roles, reason=ctx.author.name + f" - {reason}")
@@ -1346,6 +1349,7 @@ class Moderation(Cog):
                 member.id,
                 ctx.guild.id,
             )
+            self.bot.joins.unjail(ctx.guild.id, member.id)
             return await ctx.alert(f"Unable to jail {member.mention}!")
 
         notify = await self.notify(ctx.author, ctx.command.name, member, reason)
@@ -1415,6 +1419,7 @@ class Moderation(Cog):
                 ctx.guild.id,
                 member.id,
             )
+            self.bot.joins.unjail(ctx.guild.id, member.id)
         except:
             return await ctx.alert(f"Unable to unjail {member.mention}!")
 
@@ -1,16 +1,14 @@
 import asyncio
 import re
-from collections import defaultdict
 from contextlib import suppress
 from typing import Annotated, List, Optional, Union
 
 from discord import (
     Color,
     Embed,
-    File,
+    HTTPException,
     Member,
     Message,
-    NotFound,
     RawReactionActionEvent,
     TextChannel,
 )
@@ -24,7 +22,7 @@ from discord.ext.commands import (
 from discord.ui import Button, View
 
 from structure.scare import Scare, ratelimiter
-from structure.managers import Context
+from structure.managers import Context, JoinEvent
 from structure.utilities import DiscordEmoji, YouTuber
 
 
@@ -38,196 +36,29 @@ class Joindm(View):
 class Notifications(Cog):
     def __init__(self, bot: Scare):
         self.bot = bot
-        self.locks = defaultdict(asyncio.Lock)
 
     @Cog.listener()
     async def on_raw_reaction_remove(self, payload: RawReactionActionEvent):
-        if panel_message_id := await self.bot.db.fetchval(
-            """
-            SELECT panel_message_id FROM skullboard_message 
-            WHERE guild_id = $1 AND channel_id = $2 
-            AND message_id = $3 
-            """,
-            payload.guild_id,
-            payload.channel_id,
-            payload.message_id,
-        ):
-            if res := await self.bot.db.fetchrow(
-                "SELECT * FROM skullboard WHERE guild_id = $1", payload.guild_id
-            ):
-                if channel := self.bot.get_channel(res["channel_id"]):
-                    if res["emoji"] == str(payload.emoji):
-                        message = await self.bot.get_channel(
-                            payload.channel_id
-                        ).fetch_message(payload.message_id)
-                        reaction = next(
-                            r
-                            for r in message.reactions
-                            if str(r.emoji) == str(payload.emoji)
-                        )
-                        m = await channel.fetch_message(panel_message_id)
-                        return await m.edit(
-                            content=f"**#{reaction.count}** {payload.emoji}"
-                        )
+        if payload.guild_id:
+            self.bot.skullboard.handle(payload, -1)
 
     @Cog.listener()
     async def on_raw_reaction_add(self, payload: RawReactionActionEvent):
-        if not (
-            result := await self.bot.db.fetchrow(
-                "SELECT * FROM skullboard WHERE guild_id = $1", payload.guild_id
-            )
-        ):
-            return
-
-        channel = self.bot.get_channel(result.channel_id)
-        if not channel:
-            return
-
-        payload_channel = self.bot.get_channel(payload.channel_id)
-
-        emoji = result.emoji
-        count = result.count
-
-        if str(payload.emoji) != emoji:
-            return
-
-        if await self.bot.db.fetchrow(
-            "SELECT * FROM skullboard_message WHERE panel_message_id = $1",
-            payload.message_id,
-        ):
-            return
-
-        async with self.locks[f"{payload.emoji}-{payload.message_id}"]:
-            message = await payload_channel.fetch_message(payload.message_id)
-            if not (message.content or message.attachments):
-                return
-
-            reaction = next(
-                r for r in message.reactions if str(r.emoji) == str(payload.emoji)
-            )
-            if reaction.count < count:
-                return
-
-            author = self.bot.get_guild(payload.guild_id).get_member(
-                payload.message_author_id
-            )
-            content = f"**#{reaction.count}** {reaction.emoji}"
-
-            if re := await self.bot.db.fetchrow(
-                """
-                SELECT * FROM skullboard_message WHERE
-                guild_id = $1 AND channel_id = $2
-                AND message_id = $3 
-                """,
-                payload.guild_id,
-                payload.channel_id,
-                payload.message_id,
-            ):
-                with suppress(NotFound):
-                    m = await channel.fetch_message(re.panel_message_id)
-                    return await m.edit(content=content)
-
-            desc = message.content
-            if ref := getattr(message.reference, "resolved", None):
-                desc += f"\nReplying to [{ref.author}]({ref.jump_url})"
-
-            embed = Embed(
-                color=self.bot.color,
-                description=desc,
-                title=f"#{message.channel}",
-                url=message.jump_url,
-                timestamp=message.created_at,
-            )
-
-            file: Optional[File] = None
-            if len(message.attachments) > 0:
-                attachment = message.attachments[0]
-                if attachment.filename.endswith(("png", "gif", "jpeg", "jpg")):
-                    embed.set_image(url=attachment.url)
-                elif attachment.filename.endswith(("mp4", "mov")):
-                    file = File(
-                        await self.bot.urltobyte(attachment.url),
-                        filename=attachment.filename,
-                    )
-
-            embed.set_author(name=str(author), icon_url=author.display_avatar.url)
-
-            mes = await channel.send(content=content, embed=embed, file=file)
-
-            await self.bot.db.execute(
-                """
-                INSERT INTO skullboard_message VALUES ($1,$2,$3,$4)
-                ON CONFLICT (guild_id, channel_id, message_id)
-                DO UPDATE SET panel_message_id = $4   
-                """,
-                payload.guild_id,
-                payload.channel_id,
-                payload.message_id,
-                mes.id,
-            )
+        if payload.guild_id:
+            self.bot.skullboard.handle(payload, 1)
 
     @Cog.listener("on_message")
     async def on_sticky_message(self, message: Message):
         if message.guild:
-            if result := await self.bot.db.fetchval(
-                """
-                SELECT (message_id, message) FROM sticky_message
-                WHERE guild_id = $1 AND channel_id = $2 
-                """,
-                message.guild.id,
-                message.channel.id,
-            ):
-                if not ratelimiter(
-                    bucket=f"stickymessage-{message.channel.id}",
-                    key="stickymessage",
-                    rate=3,
-                    per=10,
-                ):
-                    message_id, msg = result
-                    with suppress(Exception):
-                        m = await message.channel.fetch_message(message_id)
-                        await m.delete()
-                        code = await self.bot.embed.convert(message.author, msg)
-                        code.pop("delete_after", None)
-                        ms = await message.channel.send(**code)
-                        await self.bot.db.execute(
-                            """
-                            UPDATE sticky_message SET message_id = $1
-                            WHERE guild_id = $2 AND channel_id = $3 
-                            """,
-                            ms.id,
-                            ms.guild.id,
-                            ms.channel.id,
-                        )
+            self.bot.sticky.schedule(message)
 
     @Cog.listener("on_message")
     async def on_autoreaction(self, message: Message):
         if message.guild:
             if isinstance(message.author, Member):
                 if not message.author.bot:
-                    result: str = (
-                        await self.bot.db.fetchval(
-                            """
-                        SELECT reactions FROM autoreact 
-                        WHERE guild_id = $1 AND trigger = $2 
-                        AND strict = $3
-                        """,
-                            message.guild.id,
-                            message.content,
-                            True,
-                        )
-                        or next(
-                            (
-                                r.reactions
-                                for r in await self.bot.db.fetch(
-                                    "SELECT reactions, trigger FROM autoreact WHERE guild_id = $1 AND strict = $2",
-                                    message.guild.id,
-                                    False,
-                                )
-                                if r.trigger in message.content
-                            ),
-                            None,
-                        )
+                    result: str = self.bot.settings.match(
+                        "autoreact", message.guild.id, message.content
                     )
 
                     if result:
@@ -247,29 +78,8 @@ class Notifications(Cog):
         if message.guild:
             if isinstance(message.author, Member):
                 if not message.author.bot:
-                    result: str = (
-                        await self.bot.db.fetchval(
-                            """
-                        SELECT response FROM autoresponder 
-                        WHERE guild_id = $1 AND trigger = $2 
-                        AND strict = $3
-                        """,
-                            message.guild.id,
-                            message.content,
-                            True,
-                        )
-                        or next(
-                            (
-                                r.response
-                                for r in await self.bot.db.fetch(
-                                    "SELECT response, trigger FROM autoresponder WHERE guild_id = $1 AND strict = $2",
-                                    message.guild.id,
-                                    False,
-                                )
-                                if r.trigger in message.content
-                            ),
-                            None,
-                        )
+                    result: str = self.bot.settings.match(
+                        "autoresponder", message.guild.id, message.content
                     )
 
                     if result:
@@ -319,11 +129,15 @@ class Notifications(Cog):
                     code.pop("delete_after", None)
                     await channel.send(**code)
 
-    @Cog.listener("on_member_join")
-    async def on_join_dm(self: "Notifications", member: Member):
-        if message := await self.bot.db.fetchval(
-            "SELECT message FROM joindm WHERE guild_id = $1", member.guild.id
-        ):
+    @Cog.listener("on_join_pipeline")
+    async def on_join_dm(self: "Notifications", event: JoinEvent):
+        # a raid would turn the joindm into thousands of rate limited DMs
+        if event.rejected or event.raid:
+            return
+
+        member = event.member
+
+        if message := event.settings.joindm:
             async with asyncio.Lock():
                 await asyncio.sleep(30)
                 with suppress(Exception):
@@ -332,18 +146,16 @@ class Notifications(Cog):
                     code["view"] = Joindm(member.guild.name)
                     await member.send(**code)
 
-    @Cog.listener("on_member_join")
-    async def welcome_send(self: "Notifications", member: Member):
-        for record in await self.bot.db.fetch(
-            """
-                SELECT channel_id, message
-                FROM welcome
-                WHERE guild_id = $1
-                """,
-            member.guild.id,
-        ):
-            if channel := self.bot.get_channel(record["channel_id"]):
-                code = await self.bot.embed.convert(member, record["message"])
+    @Cog.listener("on_join_pipeline")
+    async def welcome_send(self: "Notifications", event: JoinEvent):
+        if event.rejected or event.raid:
+            return
+
+        member = event.member
+
+        for channel_id, message in event.settings.welcome:
+            if channel := self.bot.get_channel(channel_id):
+                code = await self.bot.embed.convert(member, message)
                 await channel.send(**code)
 
     @Cog.listener("on_member_remove")
@@ -388,6 +200,7 @@ class Notifications(Cog):
             channel.id,
             message,
         )
+        await self.bot.joins.refresh(ctx.guild.id)
 
         return await ctx.confirm(
             f"Successfully set a welcome message to {channel.mention}!"
@@ -416,6 +229,7 @@ class Notifications(Cog):
         if result == "DELETE 0":
             return await ctx.alert(f"You haven't setup welcome in {channel.mention}!")
 
+        await self.bot.joins.refresh(ctx.guild.id)
         return await ctx.confirm(
             f"Successfully removed welcome channel from {channel.mention}!"
         )
@@ -497,6 +311,7 @@ class Notifications(Cog):
         if result == "DELETE 0":
             return await ctx.alert("You haven't setup any welcome channels!")
 
+        await self.bot.joins.refresh(ctx.guild.id)
         return await ctx.confirm("Successfully removed all welcome channels!")
 
     @group(
@@ -662,6 +477,7 @@ class Notifications(Cog):
         r = await self.bot.db.execute(
             "DELETE FROM sticky_message WHERE guild_id = $1", ctx.guild.id
         )
+        self.bot.sticky.clear(ctx.guild.id)
 
         if r == "DELETE 0":
             return await ctx.alert("There are no sticky messages in this server")
@@ -703,26 +519,18 @@ class Notifications(Cog):
         Remove a sticky message from a channel
         """
 
-        message_id = await self.bot.db.fetchval(
-            """
-            SELECT message_id FROM sticky_message
-            WHERE guild_id = $1 AND channel_id = $2 
-            """,
-            ctx.guild.id,
-            channel.id,
-        )
-
-        if not message_id:
+        if not (sticky := self.bot.sticky.remove(channel.id)):
             return await ctx.alert("There's no sticky message for this channel")
 
-        message = await channel.fetch_message(message_id)
-        await message.delete()
         await self.bot.db.execute(
             "DELETE FROM sticky_message WHERE guild_id = $1 AND channel_id = $2",
             ctx.guild.id,
             channel.id,
         )
 
+        with suppress(HTTPException):
+            await channel.get_partial_message(sticky.message_id).delete()
+
         return await ctx.confirm("Removed the sticky message from this channel")
 
     @sticky_message.command(name="add", aliases=["set"])
@@ -734,16 +542,9 @@ class Notifications(Cog):
         Add a sticky message to a channel
         """
 
-        if message_id := await self.bot.db.fetchval(
-            """
-            SELECT message_id FROM sticky_message
-            WHERE guild_id = $1 AND channel_id = $2
-            """,
-            ctx.guild.id,
-            channel.id,
-        ):
-            m = await channel.fetch_message(message_id)
-            await m.delete()
+        if sticky := self.bot.sticky.get(channel.id):
+            with suppress(HTTPException):
+                await channel.get_partial_message(sticky.message_id).delete()
 
         try:
             code = await self.bot.embed.convert(ctx.author, message)
@@ -765,6 +566,7 @@ class Notifications(Cog):
             m.id,
             message,
         )
+        self.bot.sticky.add(ctx.guild.id, channel.id, m.id, message)
 
         return await ctx.confirm(
             f"Added a sticky message in {channel.mention} -> {m.jump_url}"
@@ -794,6 +596,7 @@ class Notifications(Cog):
             ctx.guild.id,
             message,
         )
+        await self.bot.joins.refresh(ctx.guild.id)
 
         return await ctx.confirm(
             "Updated the joindm message. Please test it by using `joindm test`"
@@ -813,6 +616,7 @@ class Notifications(Cog):
         if r == "DELETE 0":
             return await ctx.alert("This feature wasn't enabled")
 
+        await self.bot.joins.refresh(ctx.guild.id)
         return await ctx.confirm("Disabled the joindm feature")
 
     @joindm.command(name="test")
@@ -883,6 +687,7 @@ class Notifications(Cog):
             True,
             reactions,
         )
+        await self.bot.settings.refresh("autoreact", ctx.guild.id)
 
         if r == "INSERT 1":
             return await ctx.confirm(
@@ -961,6 +766,7 @@ class Notifications(Cog):
             """,
             *args,
         )
+        await self.bot.settings.refresh("autoreact", ctx.guild.id)
 
         return await ctx.confirm(
             f"Updated autoreaction's strictness to `{not strictness}`"
@@ -978,6 +784,7 @@ class Notifications(Cog):
             ctx.guild.id,
             trigger,
         )
+        await self.bot.settings.refresh("autoreact", ctx.guild.id)
 
         if r == "DELETE 0":
             return await ctx.alert("There's no autoreact with this trigger")
@@ -1063,6 +870,7 @@ class Notifications(Cog):
             response,
             True,
         )
+        await self.bot.settings.refresh("autoresponder", ctx.guild.id)
 
         if r.startswith("INSERT"):
             return await ctx.confirm(
@@ -1085,6 +893,7 @@ class Notifications(Cog):
             ctx.guild.id,
             trigger,
         )
+        await self.bot.settings.refresh("autoresponder", ctx.guild.id)
 
         if r == "DELETE 0":
             return await ctx.alert("There's no autoresponder with this trigger")
@@ -1120,6 +929,7 @@ class Notifications(Cog):
             """,
             *args,
         )
+        await self.bot.settings.refresh("autoresponder", ctx.guild.id)
 
         return await ctx.confirm(
             f"Updated autoresponder's strictness to `{not strictness}`"
@@ -1354,6 +1164,7 @@ class Notifications(Cog):
         if r == "INSERT 0":
             return await ctx.alert("Skullboard is **already** enabled")
 
+        await self.bot.skullboard.refresh(ctx.guild.id)
         return await ctx.confirm("Enabled skullboard")
 
     @skullboard.command(name="disable", aliases=["dis", "remove", "rem", "rm"])
@@ -1373,6 +1184,7 @@ class Notifications(Cog):
         await self.bot.db.execute(
             "DELETE FROM skullboard_message WHERE guild_id = $1", ctx.guild.id
         )
+        await self.bot.skullboard.refresh(ctx.guild.id)
 
         return await ctx.confirm("Disabled skullboard")
 
@@ -1394,6 +1206,7 @@ class Notifications(Cog):
         if r == "UPDATE 0":
             return await ctx.alert("Skullboard is not enabled...")
 
+        await self.bot.skullboard.refresh(ctx.guild.id)
         return await ctx.confirm(f"Updated the skullboard channel to {channel.mention}")
 
     @skullboard.command(name="count")
@@ -1413,6 +1226,7 @@ class Notifications(Cog):
         if r == "UPDATE 0":
             return await ctx.alert("Skullboard is not enabled...")
 
+        await self.bot.skullboard.refresh(ctx.guild.id)
         return await ctx.confirm(f"Updated the skullboard count to `{count}`")
 
     @skullboard.command(name="emoji")
@@ -1433,6 +1247,7 @@ class Notifications(Cog):
         if r == "UPDATE 0":
             return await ctx.alert("Skullboard is not enabled...")
 
+        await self.bot.skullboard.refresh(ctx.guild.id)
         return await ctx.confirm("Updated the skullboard emoji")
 
     @skullboard.command(name="settings")
@@ -105,6 +105,7 @@ class Premium(Cog):
             value,
         )
 
+        await self.bot.settings.refresh_reskin(ctx.author.id)
         return await ctx.confirm(
             f"Updated the reskin's color to `{color if value else 'default'}`"
         )
@@ -122,6 +123,8 @@ class Premium(Cog):
         if r == "DELETE 0":
             return await ctx.alert("You do not have a reskin")
 
+        self.bot.settings.reskins.pop(ctx.author.id, None)
+
         return await ctx.confirm("Deleted your reskin")
 
     @reskin.command(name="copy")
@@ -148,6 +151,7 @@ class Premium(Cog):
             *results,
         )
 
+        await self.bot.settings.refresh_reskin(ctx.author.id)
         return await ctx.confirm(f"Copied {member.mention}'s reskin")
 
     @reskin.command(name="avatar", aliases=["av", "icon", "pfp"])
@@ -168,6 +172,7 @@ class Premium(Cog):
             avatar.url,
         )
 
+        await self.bot.settings.refresh_reskin(ctx.author.id)
         return await ctx.confirm("Updated your reskin's avatar")
 
     @reskin.command(name="name", aliases=["username"])
@@ -188,6 +193,7 @@ class Premium(Cog):
             name,
         )
 
+        await self.bot.settings.refresh_reskin(ctx.author.id)
         return await ctx.confirm(
             f"Updated your reskin username to: **{name or self.bot.user.name}**"
         )
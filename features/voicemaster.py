@@ -1,5 +1,4 @@
 import asyncio
-import json
 from asyncio import Lock
 from collections import defaultdict
 
@@ -19,21 +18,15 @@ def is_vc_owner():
             await ctx.alert("You are **not** in a voice channel")
             return False
 
-        results = await ctx.bot.db.fetchval(
-            "SELECT voice_channels FROM voicemaster WHERE guild_id = $1", ctx.guild.id
-        )
-
-        if not results:
+        if ctx.guild.id not in ctx.bot.voicemaster.join:
             await ctx.alert("The voicemaster feature is not configured in this server")
             return False
 
-        voice_channels: dict = json.loads(results)
-
-        if not str(channel.id) in voice_channels.keys():
+        if not (owner_id := ctx.bot.voicemaster.owner(channel.id)):
             await ctx.alert("You are **not** in a voice channel created by me")
             return False
 
-        if voice_channels[str(channel.id)] != ctx.author.id:
+        if owner_id != ctx.author.id:
             await ctx.alert("You do **not** own this voice channel")
             return False
 
@@ -48,9 +41,7 @@ class VoiceMaster(commands.Cog):
         self.locks = defaultdict(Lock)
 
     async def build_interface(self: "VoiceMaster", ctx: Context):
-        channel_id = await self.bot.db.fetchval(
-            "SELECT channel_id FROM voicemaster WHERE guild_id = $1", ctx.guild.id
-        )
+        channel_id = self.bot.voicemaster.join.get(ctx.guild.id)
 
         if not (channel := ctx.guild.get_channel(channel_id)):
             raise commands.BadArgument("The voicemaster feature is **not** configured")
@@ -68,7 +59,6 @@ class VoiceMaster(commands.Cog):
         self: "VoiceMaster",
         member: discord.Member,
         after: discord.VoiceState,
-        vcs: dict,
     ):
         channel = await member.guild.create_voice_channel(
             name=f"{member.name}'s channel",
@@ -79,14 +69,10 @@ class VoiceMaster(commands.Cog):
         )
 
         try:
-            vcs[channel.id] = member.id
-            await self.bot.db.execute(
-                "UPDATE voicemaster SET voice_channels = $1 WHERE guild_id = $2",
-                json.dumps(vcs),
-                member.guild.id,
-            )
+            await self.bot.voicemaster.add(member.guild.id, channel.id, member.id)
             return await member.move_to(channel)
         except discord.HTTPException:
+            await self.bot.voicemaster.remove(member.guild.id, channel.id)
             return await channel.delete()
 
     @commands.Cog.listener()
@@ -96,43 +82,44 @@ class VoiceMaster(commands.Cog):
         before: discord.VoiceState,
         after: discord.VoiceState,
     ):
-        if result := await self.bot.db.fetchrow(
-            "SELECT * FROM voicemaster WHERE guild_id = $1", member.guild.id
-        ):
-            if after.channel != before.channel:
-                async with self.locks[member.guild.id]:
-                    if channel := member.guild.get_channel(result.channel_id):
-                        vcs = json.loads(result.voice_channels)
-                        if len(channel.category.channels) > 50:
-                            return await member.move_to(None)
-
-                        if (
-                            after.channel == channel
-                            and getattr(before.channel, "category", None)
-                            != channel.category
-                        ):
-                            return await self.create_temporary_channel(
-                                member, after, vcs
+        # mute, deafen and stream toggles never touch the registry
+        if after.channel == before.channel:
+            return
+
+        if not (channel_id := self.bot.voicemaster.join.get(member.guild.id)):
+            return
+
+        async with self.locks[member.guild.id]:
+            if channel := member.guild.get_channel(channel_id):
+                if len(channel.category.channels) > 50:
+                    return await member.move_to(None)
+
+                if (
+                    after.channel == channel
+                    and getattr(before.channel, "category", None) != channel.category
+                ):
+                    return await self.create_temporary_channel(member, after)
+
+                elif (
+                    before.channel in channel.category.channels
+                    and before.channel != channel
+                ):
+                    if len(
+                        before.channel.members
+                    ) == 0 and self.bot.voicemaster.is_temporary(before.channel.id):
+                        if after.channel == channel:
+                            return await member.move_to(before.channel)
+                        elif before.channel != channel:
+                            await self.bot.voicemaster.remove(
+                                member.guild.id, before.channel.id
                             )
+                            await before.channel.delete()
 
-                        elif (
-                            before.channel in channel.category.channels
-                            and before.channel != channel
-                        ):
-                            if (
-                                len(before.channel.members) == 0
-                                and str(before.channel.id) in vcs.keys()
-                            ):
-                                if after.channel == channel:
-                                    return await member.move_to(before.channel)
-                                elif before.channel != channel:
-                                    vcs.pop(before.channel.id, None)
-                                    await self.bot.db.execute(
-                                        "UPDATE voicemaster SET voice_channels = $1 WHERE guild_id = $2",
-                                        json.dumps(vcs),
-                                        member.guild.id,
-                                    )
-                                    await before.channel.delete()
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(
+        self: "VoiceMaster", channel: discord.abc.GuildChannel
+    ):
+        await self.bot.voicemaster.remove(channel.guild.id, channel.id)
 
     @commands.command()
     @commands.has_permissions(administrator=True)
@@ -160,11 +147,7 @@ class VoiceMaster(commands.Cog):
         Setup the voicemaster feature
         """
 
-        result = await self.bot.db.fetchrow(
-            "SELECT * FROM voicemaster WHERE guild_id = $1", ctx.guild.id
-        )
-
-        if result:
+        if ctx.guild.id in self.bot.voicemaster.join:
             return await ctx.alert(f"The VoiceMaster feature is **already** configured")
 
         category = await ctx.guild.create_category(name="Voice Channels")
@@ -184,6 +167,7 @@ class VoiceMaster(commands.Cog):
             ctx.guild.id,
             channel.id,
         )
+        self.bot.voicemaster.configure(ctx.guild.id, channel.id)
         kwargs = await self.build_interface(ctx)
         await interface.send(**kwargs)
         return await ctx.confirm("Configured the VoiceMaster feature")
@@ -195,16 +179,14 @@ class VoiceMaster(commands.Cog):
         Disable the voicemaster feature
         """
 
-        result = await self.bot.db.fetchrow(
-            "SELECT * FROM voicemaster WHERE guild_id = $1", ctx.guild.id
-        )
-
-        if not result:
+        if not (channel_id := self.bot.voicemaster.join.get(ctx.guild.id)):
             return await ctx.alert("VoiceMaster feature is **not** enabled")
 
-        voice_channels = [ctx.guild.get_channel(result.channel_id)]
-        vcs = json.loads(result.voice_channels)
-        voice_channels.extend([ctx.guild.get_channel(i) for i in vcs.keys()])
+        voice_channels = [ctx.guild.get_channel(channel_id)]
+        voice_channels.extend(
+            ctx.guild.get_channel(i)
+            for i in await self.bot.voicemaster.disable(ctx.guild.id)
+        )
         await asyncio.gather(
             *[channel.delete() for channel in voice_channels if channel]
         )
@@ -396,30 +378,13 @@ class VoiceMaster(commands.Cog):
         if not channel:
             return await ctx.alert("You are **not** in a voice channel")
 
-        voice_channels: dict = json.loads(
-            await self.bot.db.fetchval(
-                "SELECT voice_channels FROM voicemaster WHERE guild_id = $1",
-                ctx.guild.id,
-            )
-        )
-
-        voice = next(
-            ((x, y) for x, y in voice_channels.items() if x == str(channel.id)), None
-        )
-
-        if not voice:
+        if not (owner_id := self.bot.voicemaster.owner(channel.id)):
             return await ctx.alert("You are **not** in a voice channel created by me")
 
-        if voice[1] in map(lambda m: m.id, channel.members):
+        if owner_id in map(lambda m: m.id, channel.members):
             return await ctx.alert("The owner is still in the voice channel")
 
-        voice_channels[str(channel.id)] = ctx.author.id
-
-        await self.bot.db.execute(
-            "UPDATE voicemaster SET voice_channels = $1 WHERE guild_id = $2",
-            json.dumps(voice_channels),
-            ctx.guild.id,
-        )
+        await self.bot.voicemaster.claim(channel.id, ctx.author.id)
 
         return await ctx.confirm("You have claimed the ownership of this voice channel")
 
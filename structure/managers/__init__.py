@@ -1,8 +1,22 @@
+from .antinuke import *
+from .antispam import *
 from .cache import *
 from .context import *
 from .database import *
+from .joins import *
 from .logger import *
+from .logs import *
 from .paginator import *
 from .ratelimit import *
 from .session import *
+from .reactionroles import *
+from .restore import *
+from .settings import *
+from .skullboard import *
+from .snipe import *
+from .sticky import *
+from .tracker import *
+from .usage import *
+from .voicemaster import *
+from .webhooks import *
 from .workers import *
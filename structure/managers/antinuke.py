@@ -0,0 +1,124 @@
+import json
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional, Set, Tuple
+
+from .database import Record
+
+if TYPE_CHECKING:
+    from structure.scare import Scare
+
+# default (actions, seconds) before an actor is treated as nuking
+THRESHOLDS: Dict[str, Tuple[int, float]] = {
+    "ban": (3, 60),
+    "kick": (3, 60),
+    "role_delete": (2, 60),
+    "role_create": (3, 60),
+    "channel_delete": (2, 60),
+    "channel_create": (3, 60),
+    "webhook_create": (2, 60),
+    "webhook_delete": (2, 60),
+    "sticker_create": (5, 60),
+    "sticker_delete": (3, 60),
+    "emoji_create": (5, 60),
+    "emoji_delete": (3, 60),
+    "member_role_update": (1, 60),
+    "role_update": (1, 60),
+}
+
+
+class AntinukeConfig:
+    __slots__ = ("guild_id", "modules", "owners", "whitelisted", "logs")
+
+    def __init__(self, record: Record):
+        self.guild_id: int = record.guild_id
+        self.modules: Dict[str, Dict[str, Any]] = json.loads(record.modules)
+        self.owners: Set[int] = set(record.owners)
+        self.whitelisted: Set[int] = set(record.whitelisted)
+        self.logs: Optional[int] = record.logs
+
+    def threshold(self, action: str) -> Tuple[int, float]:
+        module = self.modules.get(action) or {}
+        count, per = THRESHOLDS.get(action, (1, 60))
+        return module.get("threshold", count), module.get("per", per)
+
+
+class AntinukeSettings:
+    def __init__(self: "AntinukeSettings", bot: "Scare"):
+        self.bot = bot
+        self.guilds: Dict[int, AntinukeConfig] = {}
+
+    async def load(self: "AntinukeSettings"):
+        self.guilds = {
+            record.guild_id: AntinukeConfig(record)
+            for record in await self.bot.db.fetch("SELECT * FROM antinuke")
+        }
+
+    async def refresh(
+        self: "AntinukeSettings", guild_id: int
+    ) -> Optional[AntinukeConfig]:
+        if record := await self.bot.db.fetchrow(
+            "SELECT * FROM antinuke WHERE guild_id = $1", guild_id
+        ):
+            config = self.guilds[guild_id] = AntinukeConfig(record)
+            return config
+
+        self.guilds.pop(guild_id, None)
+
+    def get(self: "AntinukeSettings", guild_id: int) -> Optional[AntinukeConfig]:
+        return self.guilds.get(guild_id)
+
+    def is_owner(self: "AntinukeSettings", guild_id: int, user_id: int) -> bool:
+        return bool((config := self.guilds.get(guild_id)) and user_id in config.owners)
+
+
+class ActionTracker:
+    def __init__(self: "ActionTracker", idle: float = 300):
+        self.idle = idle
+        self.windows: Dict[Tuple[int, int, str], Deque[Tuple[float, Any]]] = {}
+        # actions that already tripped their threshold, until the window runs out,
+        # so a role grant doesn't arm the tripwire for the actor's next ban
+        self.tripped: Dict[Tuple[int, int, str], float] = {}
+        self.swept = time.monotonic()
+
+    def sweep(self: "ActionTracker", now: float):
+        self.swept = now
+        for key in [
+            k for k, w in self.windows.items() if not w or now - w[-1][0] > self.idle
+        ]:
+            del self.windows[key]
+
+        for key in [k for k, d in self.tripped.items() if d <= now]:
+            del self.tripped[key]
+
+    def hit(
+        self: "ActionTracker",
+        guild_id: int,
+        user_id: int,
+        action: str,
+        target: Any,
+        threshold: Tuple[int, float],
+    ) -> Optional[List[Any]]:
+        now = time.monotonic()
+        if now - self.swept > self.idle:
+            self.sweep(now)
+
+        count, per = threshold
+        key = (guild_id, user_id, action)
+
+        if self.tripped.get(key, 0) > now:
+            return [target]
+
+        if not (window := self.windows.get(key)):
+            window = self.windows[key] = deque()
+
+        while window and now - window[0][0] > per:
+            window.popleft()
+
+        window.append((now, target))
+
+        if len(window) >= count:
+            self.tripped[key] = now + per
+            targets = [t for _, t in window]
+            window.clear()
+            return targets
@@ -0,0 +1,64 @@
+import asyncio
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+
+class SpamState:
+    __slots__ = ("timestamps", "message_ids", "lock")
+
+    def __init__(self, threshold: int):
+        self.timestamps: Deque[float] = deque(maxlen=threshold)
+        self.message_ids: Deque[int] = deque(maxlen=threshold)
+        self.lock = asyncio.Lock()
+
+    @property
+    def last(self) -> float:
+        return self.timestamps[-1] if self.timestamps else 0
+
+
+class SpamDetector:
+    def __init__(
+        self: "SpamDetector", threshold: int = 4, window: float = 1, idle: float = 60
+    ):
+        self.threshold = threshold
+        self.window = window
+        self.idle = idle
+        self.states: Dict[Tuple[int, int], SpamState] = {}
+        self.swept = time.monotonic()
+
+    def state(self: "SpamDetector", guild_id: int, user_id: int) -> SpamState:
+        if not (state := self.states.get((guild_id, user_id))):
+            state = self.states[(guild_id, user_id)] = SpamState(self.threshold)
+
+        return state
+
+    def sweep(self: "SpamDetector", now: float):
+        # drop users that went quiet, keeping memory bounded without timers
+        self.swept = now
+        for key in [
+            k
+            for k, s in self.states.items()
+            if now - s.last > self.idle and not s.lock.locked()
+        ]:
+            del self.states[key]
+
+    def hit(
+        self: "SpamDetector", guild_id: int, user_id: int, message_id: int
+    ) -> Optional[List[int]]:
+        now = time.monotonic()
+        if now - self.swept > self.idle:
+            self.sweep(now)
+
+        state = self.state(guild_id, user_id)
+        state.timestamps.append(now)
+        state.message_ids.append(message_id)
+
+        if (
+            len(state.timestamps) == self.threshold
+            and now - state.timestamps[0] <= self.window
+        ):
+            message_ids = list(state.message_ids)
+            state.timestamps.clear()
+            state.message_ids.clear()
+            return message_ids
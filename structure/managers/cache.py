@@ -1,44 +1,191 @@
 import asyncio
-from typing import Any, Optional
+import heapq
+import time
+from contextlib import suppress
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
-from numpy import isin
+
+class Entry:
+    __slots__ = ("value", "deadline", "deadlines")
+
+    def __init__(self, value: Any, deadline: Optional[float] = None):
+        self.value = value
+        self.deadline = deadline
+        # per item deadlines for appended lists, aligned with `value`,
+        # `deadline` is then the earliest of them
+        self.deadlines: Optional[Deque[float]] = None
 
 
 class Cache:
-    def __init__(self):
-        self.inventory = {}
+    def __init__(
+        self,
+        maxsize: int = 10_000,
+        maxitems: int = 250,
+        resolution: float = 1.0,
+    ):
+        # namespaces are only created by writes, lookups never add one
+        self.inventory: Dict[str, "OrderedDict[str, Entry]"] = {}
+        self.maxsize = maxsize
+        self.maxitems = maxitems
+        self.resolution = resolution
+        self.timers: List[Tuple[float, str]] = []
+        self.sweeper: Optional[asyncio.Task] = None
+        self.wakeup: Optional[asyncio.Event] = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @staticmethod
+    def namespace(key: str) -> str:
+        return key.split("-", 1)[0]
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            "keys": sum(map(len, self.inventory.values())),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def schedule(self, key: str, deadline: float):
+        heapq.heappush(self.timers, (deadline, key))
+
+        if not self.sweeper or self.sweeper.done():
+            self.wakeup = asyncio.Event()
+            self.sweeper = asyncio.ensure_future(self.sweep())
+        elif self.timers[0] == (deadline, key):
+            # the sweeper is sleeping towards a later deadline
+            self.wakeup.set()
+
+    async def sweep(self):
+        while self.timers:
+            self.wakeup.clear()
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(
+                    self.wakeup.wait(),
+                    max(self.timers[0][0] - time.monotonic(), self.resolution),
+                )
+
+            now = time.monotonic()
+
+            while self.timers and self.timers[0][0] <= now:
+                deadline, key = heapq.heappop(self.timers)
+                entry = self.lookup(key)
+
+                # the key was overwritten or removed since this timer was set
+                if not entry or entry.deadline != deadline:
+                    continue
+
+                self.expire(key, entry, now)
+
+    def expire(self, key: str, entry: Entry, now: float) -> bool:
+        if entry.deadlines is not None:
+            if entry.deadline > now:
+                return False
+
+            # TTLs may differ per item, so expired items aren't only at the front
+            kept = [(d, v) for d, v in zip(entry.deadlines, entry.value) if d > now]
+            self.expirations += len(entry.value) - len(kept)
+
+            if kept:
+                entry.deadlines = deque(d for d, _ in kept)
+                entry.value[:] = [v for _, v in kept]
+                entry.deadline = min(entry.deadlines)
+                if entry.deadline != float("inf"):
+                    self.schedule(key, entry.deadline)
+
+                return False
 
-    async def do_expiration(self, key: str, time: int):
-        await asyncio.sleep(time)
-        self.remove(key)
+        elif entry.deadline is None or entry.deadline > now:
+            return False
+
+        else:
+            self.expirations += 1
+
+        self.discard(key)
+        return True
+
+    def lookup(self, key: str) -> Optional[Entry]:
+        if namespace := self.inventory.get(self.namespace(key)):
+            return namespace.get(key)
+
+    def discard(self, key: str) -> Optional[Entry]:
+        if not (namespace := self.inventory.get(self.namespace(key))):
+            return None
+
+        entry = namespace.pop(key, None)
+        if not namespace:
+            del self.inventory[self.namespace(key)]
+
+        return entry
+
+    def store(self, key: str, entry: Entry):
+        if not (namespace := self.inventory.get(self.namespace(key))):
+            namespace = self.inventory[self.namespace(key)] = OrderedDict()
+
+        if key in namespace:
+            namespace.move_to_end(key)
+        elif len(namespace) >= self.maxsize:
+            namespace.popitem(last=False)
+            self.evictions += 1
+
+        namespace[key] = entry
 
     async def append(
         self: "Cache", key: str, value: Any, expiring: Optional[int] = None
     ) -> Any:
-        if self.get(key):
-            self.inventory[key].append(value)
+        deadline = time.monotonic() + expiring if expiring else float("inf")
+
+        if (entry := self.lookup(key)) and entry.deadlines is not None:
+            self.inventory[self.namespace(key)].move_to_end(key)
+            entry.value.append(value)
+            entry.deadlines.append(deadline)
+
+            if len(entry.value) > self.maxitems:
+                entry.value.pop(0)
+                entry.deadlines.popleft()
+                self.evictions += 1
+
+            if (earliest := min(entry.deadlines)) != entry.deadline:
+                entry.deadline = earliest
+                if earliest != float("inf"):
+                    self.schedule(key, earliest)
         else:
-            self.inventory[key] = [value]
+            entry = Entry([value], deadline)
+            entry.deadlines = deque([deadline])
+            self.store(key, entry)
 
             if expiring:
-                asyncio.ensure_future(self.do_expiration(key, expiring))
+                self.schedule(key, deadline)
 
-        return self.get(key)
+        return entry.value
 
     async def add(
         self: "Cache", key: str, value: Any, expiring: Optional[int] = None
     ) -> Any:
+        deadline = time.monotonic() + expiring if expiring else None
+        self.store(key, Entry(value, deadline))
 
-        self.inventory[key] = value
-
-        if expiring:
-            asyncio.ensure_future(self.do_expiration(key, expiring))
+        if deadline:
+            self.schedule(key, deadline)
 
         return value
 
     def remove(self, key: str):
-        if self.get(key):
-            return self.inventory.pop(key)
+        if entry := self.discard(key):
+            return entry.value
 
     def get(self, key: str) -> Any:
-        return self.inventory.get(key)
+        if not (entry := self.lookup(key)) or self.expire(
+            key, entry, time.monotonic()
+        ):
+            self.misses += 1
+            return None
+
+        self.inventory[self.namespace(key)].move_to_end(key)
+        self.hits += 1
+        return entry.value
@@ -2,7 +2,7 @@ import datetime
 
 from .paginator import Paginator
 
-from discord import Embed, Message, Role, Interaction, SelectOption, ButtonStyle
+from discord import Embed, Message, NotFound, Role, Interaction, SelectOption, ButtonStyle
 from discord.ui import View, Select, Button
 from discord.embeds import EmbedProxy
 from discord.utils import as_chunks, utcnow
@@ -169,9 +169,7 @@ class Context(DefaultContext):
         if not self.guild:
             return None
 
-        result = await self.bot.db.fetchrow(
-            "SELECT * FROM reskin WHERE user_id = $1", self.author.id
-        )
+        result = self.bot.settings.reskins.get(self.author.id)
 
         if not result:
             return None
@@ -236,27 +234,22 @@ class Context(DefaultContext):
             if not reskin:
                 return await super().send(*args, **kwargs)
             else:
-                try:
-                    webhook = next(
-                        (
-                            w
-                            for w in await self.channel.webhooks()
-                            if w.user.id == self.bot.user.id
-                        ),
-                    )
-                except StopIteration:
-                    webhook = await self.channel.create_webhook(
-                        name=f"{self.bot.user.name} - reskin"
-                    )
-
                 kwargs["username"] = reskin.username
                 kwargs["avatar_url"] = reskin.avatar_url
                 kwargs["wait"] = True
                 kwargs.pop("delete_after", None)
-                return await webhook.send(*args, **kwargs)
+
+                webhook = await self.bot.webhooks.get(self.channel)
+                try:
+                    return await webhook.send(*args, **kwargs)
+                except NotFound:
+                    # the pooled webhook was deleted behind our back
+                    self.bot.webhooks.evict(self.channel.id)
+                    webhook = await self.bot.webhooks.get(self.channel)
+                    return await webhook.send(*args, **kwargs)
 
     async def reply(self, *args, **kwargs):
-        if await self.get_reskin():
+        if self.guild and self.author.id in self.bot.settings.reskins:
             return await self.send(*args, **kwargs)
         else:
             return await super().reply(*args, **kwargs)
@@ -0,0 +1,180 @@
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Deque, Dict, Optional, Set, Tuple
+
+from discord import Member
+
+from . import logger as logging
+
+if TYPE_CHECKING:
+    from structure.scare import Scare
+
+logger = logging.getLogger(__name__)
+
+
+class JoinSettings:
+    __slots__ = (
+        "whitelisted",
+        "whitelist_msg",
+        "autoroles",
+        "joindm",
+        "welcome",
+        "jail_role",
+    )
+
+    def __init__(self):
+        # None while the whitelist feature is disabled
+        self.whitelisted: Optional[Set[int]] = None
+        self.whitelist_msg: Optional[str] = None
+        self.autoroles: Tuple[int, ...] = ()
+        self.joindm: Optional[str] = None
+        # (channel id, message)
+        self.welcome: Tuple[Tuple[int, str], ...] = ()
+        self.jail_role: Optional[int] = None
+
+
+class JoinEvent:
+    __slots__ = ("member", "settings", "raid", "rejected")
+
+    def __init__(
+        self, member: Member, settings: JoinSettings, raid: bool, rejected: bool
+    ):
+        self.member = member
+        self.settings = settings
+        self.raid = raid
+        # globalbanned or not whitelisted, so the member is about to be removed
+        self.rejected = rejected
+
+
+EMPTY = JoinSettings()
+
+
+class JoinPipeline:
+    def __init__(
+        self: "JoinPipeline",
+        bot: "Scare",
+        threshold: int = 10,
+        per: float = 10,
+        cooldown: float = 60,
+    ):
+        self.bot = bot
+        self.threshold = threshold
+        self.per = per
+        self.cooldown = cooldown
+        self.guilds: Dict[int, JoinSettings] = {}
+        self.jailed: Set[Tuple[int, int]] = set()
+        self.globalbans: Dict[int, Optional[str]] = {}
+        self.joins: Dict[int, Deque[float]] = {}
+        # guild id -> raid mode deadline
+        self.raids: Dict[int, float] = {}
+
+    def settings(self: "JoinPipeline", guild_id: int) -> JoinSettings:
+        if not (settings := self.guilds.get(guild_id)):
+            settings = self.guilds[guild_id] = JoinSettings()
+
+        return settings
+
+    async def load(self: "JoinPipeline"):
+        self.guilds = {}
+
+        for record in await self.bot.db.fetch("SELECT * FROM whitelist"):
+            settings = self.settings(record.guild_id)
+            settings.whitelisted = set(record.whitelisted)
+            settings.whitelist_msg = record.msg
+
+        for record in await self.bot.db.fetch("SELECT * FROM autorole"):
+            self.settings(record.guild_id).autoroles = tuple(record.roles)
+
+        for record in await self.bot.db.fetch("SELECT * FROM joindm"):
+            self.settings(record.guild_id).joindm = record.message
+
+        for record in await self.bot.db.fetch("SELECT * FROM welcome"):
+            settings = self.settings(record.guild_id)
+            settings.welcome += ((record.channel_id, record.message),)
+
+        for record in await self.bot.db.fetch(
+            "SELECT guild_id, role_id FROM moderation"
+        ):
+            self.settings(record.guild_id).jail_role = record.role_id
+
+        self.jailed = {
+            (record.guild_id, record.user_id)
+            for record in await self.bot.db.fetch("SELECT guild_id, user_id FROM jail")
+        }
+        self.globalbans = {
+            record.user_id: record.reason
+            for record in await self.bot.db.fetch("SELECT * FROM globalban")
+        }
+
+    async def refresh(self: "JoinPipeline", guild_id: int):
+        record = await self.bot.db.fetchrow(
+            """
+            SELECT
+                (SELECT whitelisted FROM whitelist WHERE guild_id = $1) AS whitelisted,
+                (SELECT msg FROM whitelist WHERE guild_id = $1) AS whitelist_msg,
+                (SELECT roles FROM autorole WHERE guild_id = $1) AS autoroles,
+                (SELECT message FROM joindm WHERE guild_id = $1) AS joindm,
+                (SELECT role_id FROM moderation WHERE guild_id = $1) AS jail_role,
+                ARRAY(
+                    SELECT channel_id FROM welcome
+                    WHERE guild_id = $1 ORDER BY channel_id
+                ) AS welcome_channels,
+                ARRAY(
+                    SELECT message FROM welcome
+                    WHERE guild_id = $1 ORDER BY channel_id
+                ) AS welcome_messages
+            """,
+            guild_id,
+        )
+
+        settings = JoinSettings()
+        if record.whitelisted is not None:
+            settings.whitelisted = set(record.whitelisted)
+            settings.whitelist_msg = record.whitelist_msg
+
+        settings.autoroles = tuple(record.autoroles or ())
+        settings.joindm = record.joindm
+        settings.jail_role = record.jail_role
+        settings.welcome = tuple(
+            zip(record.welcome_channels, record.welcome_messages)
+        )
+        self.guilds[guild_id] = settings
+
+    def jail(self: "JoinPipeline", guild_id: int, user_id: int):
+        self.jailed.add((guild_id, user_id))
+
+    def unjail(self: "JoinPipeline", guild_id: int, user_id: int):
+        self.jailed.discard((guild_id, user_id))
+
+    def is_jailed(self: "JoinPipeline", guild_id: int, user_id: int) -> bool:
+        return (guild_id, user_id) in self.jailed
+
+    def hit(self: "JoinPipeline", guild_id: int) -> bool:
+        now = time.monotonic()
+
+        if not (joins := self.joins.get(guild_id)):
+            joins = self.joins[guild_id] = deque(maxlen=self.threshold)
+
+        joins.append(now)
+
+        if len(joins) == self.threshold and now - joins[0] <= self.per:
+            if self.raids.get(guild_id, 0) <= now:
+                logger.warning(
+                    f"Raid mode enabled in {guild_id}: {self.threshold} joins in {now - joins[0]:.1f}s"
+                )
+
+            # every join that keeps the pace up extends the raid mode
+            self.raids[guild_id] = now + self.cooldown
+
+        return self.raids.get(guild_id, 0) > now
+
+    def process(self: "JoinPipeline", member: Member):
+        settings = self.guilds.get(member.guild.id, EMPTY)
+        rejected = member.id in self.globalbans or (
+            settings.whitelisted is not None and member.id not in settings.whitelisted
+        )
+
+        self.bot.dispatch(
+            "join_pipeline",
+            JoinEvent(member, settings, self.hit(member.guild.id), rejected),
+        )
@@ -0,0 +1,99 @@
+import asyncio
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
+
+from discord import Embed, Guild, HTTPException, TextChannel
+from discord.ui import View
+
+from . import logger as logging
+
+if TYPE_CHECKING:
+    from structure.scare import Scare
+
+logger = logging.getLogger(__name__)
+
+
+class LogBatch:
+    __slots__ = ("embeds", "view", "handle", "size")
+
+    def __init__(self, view: Optional[View]):
+        self.embeds: List[Embed] = []
+        self.view = view
+        self.handle: Optional[asyncio.TimerHandle] = None
+        self.size = 0
+
+
+class LogDispatcher:
+    def __init__(
+        self: "LogDispatcher", bot: "Scare", delay: float = 2, maxlen: int = 10
+    ):
+        self.bot = bot
+        self.delay = delay
+        # discord caps a message at 10 embeds and 6000 characters across them
+        self.maxlen = maxlen
+        self.maxsize = 6000
+        self.channels: Dict[Tuple[int, str], int] = {}
+        self.batches: Dict[int, LogBatch] = {}
+        self.tasks: Set[asyncio.Task] = set()
+
+    async def load(self: "LogDispatcher"):
+        self.channels = {
+            (record.guild_id, record.log_type): record.channel_id
+            for record in await self.bot.db.fetch("SELECT * FROM logs")
+        }
+
+    def set(self: "LogDispatcher", guild_id: int, log_type: str, channel_id: int):
+        self.channels[(guild_id, log_type)] = channel_id
+
+    def remove(self: "LogDispatcher", guild_id: int, log_type: str):
+        self.channels.pop((guild_id, log_type), None)
+
+    def channel(
+        self: "LogDispatcher", guild: Guild, log_type: str
+    ) -> Optional[TextChannel]:
+        if channel_id := self.channels.get((guild.id, log_type)):
+            return guild.get_channel(channel_id)
+
+    def send(
+        self: "LogDispatcher",
+        channel: TextChannel,
+        embed: Embed,
+        view: Optional[View] = None,
+    ):
+        if (batch := self.batches.get(channel.id)) and (
+            batch.size + len(embed) > self.maxsize
+        ):
+            batch.handle.cancel()
+            self.spawn(channel)
+            batch = None
+
+        if not batch:
+            batch = self.batches[channel.id] = LogBatch(view)
+            batch.handle = asyncio.get_running_loop().call_later(
+                self.delay, self.spawn, channel
+            )
+
+        batch.embeds.append(embed)
+        batch.size += len(embed)
+
+        if len(batch.embeds) >= self.maxlen:
+            batch.handle.cancel()
+            self.spawn(channel)
+
+    def spawn(self: "LogDispatcher", channel: TextChannel):
+        if not (batch := self.batches.pop(channel.id, None)):
+            return
+
+        task = asyncio.create_task(self.flush(channel, batch))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    async def flush(self: "LogDispatcher", channel: TextChannel, batch: LogBatch):
+        try:
+            if batch.view:
+                await channel.send(silent=True, embeds=batch.embeds, view=batch.view)
+            else:
+                await channel.send(silent=True, embeds=batch.embeds)
+        except HTTPException:
+            logger.warning(
+                f"Unable to deliver {len(batch.embeds)} logs to {channel.id}"
+            )
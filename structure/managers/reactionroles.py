@@ -0,0 +1,108 @@
+import asyncio
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Optional, Set, Tuple
+
+from discord import HTTPException
+
+from . import logger as logging
+
+if TYPE_CHECKING:
+    from structure.scare import Scare
+
+logger = logging.getLogger(__name__)
+
+
+class RoleQueue:
+    __slots__ = ("pending", "task")
+
+    def __init__(self):
+        # (member id, role id) -> whether the member should end up with the role
+        self.pending: "OrderedDict[Tuple[int, int], bool]" = OrderedDict()
+        self.task: Optional[asyncio.Task] = None
+
+
+class ReactionRoles:
+    def __init__(self: "ReactionRoles", bot: "Scare"):
+        self.bot = bot
+        self.roles: Dict[Tuple[int, str], int] = {}
+        # message id -> emojis, to reject the reaction firehose before formatting
+        self.messages: Dict[int, Set[str]] = {}
+        self.queues: Dict[int, RoleQueue] = {}
+
+    async def load(self: "ReactionRoles"):
+        self.roles, self.messages = {}, {}
+
+        for record in await self.bot.db.fetch(
+            "SELECT message_id, emoji, role_id FROM reactionroles"
+        ):
+            self.add(record.message_id, record.emoji, record.role_id)
+
+    def add(self: "ReactionRoles", message_id: int, emoji: str, role_id: int):
+        self.roles[(message_id, emoji)] = role_id
+        self.messages.setdefault(message_id, set()).add(emoji)
+
+    def remove(self: "ReactionRoles", message_id: int, emoji: str):
+        self.roles.pop((message_id, emoji), None)
+
+        if emojis := self.messages.get(message_id):
+            emojis.discard(emoji)
+            if not emojis:
+                del self.messages[message_id]
+
+    def clear(self: "ReactionRoles", message_id: int):
+        for emoji in self.messages.pop(message_id, ()):
+            self.roles.pop((message_id, emoji), None)
+
+    def get(self: "ReactionRoles", message_id: int, emoji: str) -> Optional[int]:
+        return self.roles.get((message_id, emoji))
+
+    @property
+    def stats(self: "ReactionRoles") -> Dict[str, int]:
+        return {
+            "guilds": len(self.queues),
+            "pending": sum(len(q.pending) for q in self.queues.values()),
+        }
+
+    def depth(self: "ReactionRoles", guild_id: int) -> int:
+        return len(queue.pending) if (queue := self.queues.get(guild_id)) else 0
+
+    def enqueue(
+        self: "ReactionRoles", guild_id: int, member_id: int, role_id: int, add: bool
+    ):
+        if not (queue := self.queues.get(guild_id)):
+            queue = self.queues[guild_id] = RoleQueue()
+
+        # a later toggle replaces the earlier one, so add/remove pairs collapse
+        queue.pending.pop((member_id, role_id), None)
+        queue.pending[(member_id, role_id)] = add
+
+        if not queue.task or queue.task.done():
+            queue.task = asyncio.create_task(self.drain(guild_id, queue))
+
+    async def drain(self: "ReactionRoles", guild_id: int, queue: RoleQueue):
+        # one request in flight per guild; discord.py paces it to the rate limit
+        while queue.pending:
+            (member_id, role_id), add = queue.pending.popitem(last=False)
+
+            if not (guild := self.bot.get_guild(guild_id)):
+                break
+
+            if not (member := guild.get_member(member_id)) or member.bot:
+                continue
+
+            if not (role := guild.get_role(role_id)) or (role in member.roles) == add:
+                continue
+
+            try:
+                if add:
+                    await member.add_roles(role, reason="Reactionrole")
+                else:
+                    await member.remove_roles(role, reason="Reactionrole")
+            except HTTPException:
+                logger.warning(
+                    f"Unable to update reaction role {role_id} in {guild_id}, "
+                    f"{len(queue.pending)} updates still queued"
+                )
+
+        if self.queues.get(guild_id) is queue and not queue.pending:
+            del self.queues[guild_id]
@@ -0,0 +1,291 @@
+import asyncio
+import time
+from collections import OrderedDict, defaultdict
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Set, Tuple
+
+from discord import (
+    ChannelType,
+    Colour,
+    Guild,
+    HTTPException,
+    Object,
+    PermissionOverwrite,
+    Permissions,
+    Role,
+)
+from discord.abc import GuildChannel
+
+from . import logger as logging
+
+if TYPE_CHECKING:
+    from structure.scare import Scare
+
+logger = logging.getLogger(__name__)
+
+REASON = "Antinuke: restoring deleted objects"
+
+
+class RoleSnapshot:
+    __slots__ = (
+        "id",
+        "name",
+        "permissions",
+        "color",
+        "hoist",
+        "mentionable",
+        "position",
+        "stored",
+    )
+
+    def __init__(self, role: Role):
+        self.id = role.id
+        self.name = role.name
+        self.permissions = role.permissions.value
+        self.color = role.color.value
+        self.hoist = role.hoist
+        self.mentionable = role.mentionable
+        self.position = role.position
+        self.stored = time.monotonic()
+
+
+class ChannelSnapshot:
+    __slots__ = (
+        "id",
+        "type",
+        "name",
+        "position",
+        "category_id",
+        "overwrites",
+        "options",
+        "stored",
+    )
+
+    def __init__(self, channel: GuildChannel):
+        self.id = channel.id
+        self.type = channel.type
+        self.name = channel.name
+        self.position = channel.position
+        self.category_id = channel.category_id
+        # (target id, is role, allow, deny)
+        self.overwrites: Tuple[Tuple[int, bool, int, int], ...] = tuple(
+            (target.id, isinstance(target, Role), *(p.value for p in o.pair()))
+            for target, o in channel.overwrites.items()
+        )
+        self.options: Dict[str, Any] = {}
+
+        if channel.type in (ChannelType.text, ChannelType.news, ChannelType.forum):
+            self.options = {
+                "topic": channel.topic,
+                "nsfw": channel.nsfw,
+                "slowmode_delay": channel.slowmode_delay,
+            }
+            if channel.type == ChannelType.news:
+                self.options["news"] = True
+        elif channel.type in (ChannelType.voice, ChannelType.stage_voice):
+            self.options = {
+                "bitrate": channel.bitrate,
+                "user_limit": channel.user_limit,
+            }
+
+        self.stored = time.monotonic()
+
+
+class Remapped:
+    __slots__ = ("id", "target", "stored")
+
+    def __init__(self, id: int, target: Any):
+        self.id = id
+        self.target = target
+        self.stored = time.monotonic()
+
+
+class RestorePipeline:
+    def __init__(
+        self: "RestorePipeline",
+        bot: "Scare",
+        concurrency: int = 5,
+        maxlen: int = 500,
+        expiring: int = 3600,
+    ):
+        self.bot = bot
+        self.maxlen = maxlen
+        self.expiring = expiring
+        self.roles: Dict[int, "OrderedDict[int, RoleSnapshot]"] = {}
+        self.channels: Dict[int, "OrderedDict[int, ChannelSnapshot]"] = {}
+        # deleted id -> restored object, so overwrites and children follow them,
+        # kept across runs since roles and channels are restored separately
+        self.remapped: Dict[int, "OrderedDict[int, Remapped]"] = {}
+        # shared by every restore in a guild, so a burst of entries stays bounded
+        self.semaphores: Dict[int, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(concurrency)
+        )
+        self.tasks: Set[asyncio.Task] = set()
+
+    def store(
+        self: "RestorePipeline",
+        inventory: Dict[int, "OrderedDict[int, Any]"],
+        guild_id: int,
+        snapshot: Any,
+    ):
+        if not (deleted := inventory.get(guild_id)):
+            deleted = inventory[guild_id] = OrderedDict()
+
+        deleted[snapshot.id] = snapshot
+        threshold = time.monotonic() - self.expiring
+
+        while deleted and (
+            len(deleted) > self.maxlen
+            or next(iter(deleted.values())).stored < threshold
+        ):
+            deleted.popitem(last=False)
+
+    def prune(self: "RestorePipeline"):
+        threshold = time.monotonic() - self.expiring
+
+        for guild_id in list(self.remapped):
+            remapped = self.remapped[guild_id]
+            while remapped and next(iter(remapped.values())).stored < threshold:
+                remapped.popitem(last=False)
+
+            if not remapped:
+                del self.remapped[guild_id]
+
+    def remap(self: "RestorePipeline", guild_id: int, id: int) -> Any:
+        if entry := self.remapped.get(guild_id, {}).get(id):
+            if entry.stored >= time.monotonic() - self.expiring:
+                return entry.target
+
+    def record_role(self: "RestorePipeline", role: Role):
+        self.store(self.roles, role.guild.id, RoleSnapshot(role))
+
+    def record_channel(self: "RestorePipeline", channel: GuildChannel):
+        self.store(self.channels, channel.guild.id, ChannelSnapshot(channel))
+
+    async def take(
+        self: "RestorePipeline",
+        inventory: Dict[int, "OrderedDict[int, Any]"],
+        guild_id: int,
+        ids: Iterable[int],
+    ) -> List[Any]:
+        ids = list(ids)
+
+        # the gateway delete event can land right after the audit log entry
+        if any(i not in inventory.get(guild_id, {}) for i in ids):
+            await asyncio.sleep(1)
+
+        deleted = inventory.get(guild_id, {})
+        return [s for i in ids if (s := deleted.pop(i, None))]
+
+    def spawn(self: "RestorePipeline", guild: Guild, action: str, targets: List[Any]):
+        # also drops the restored objects of guilds the bot has since left
+        self.prune()
+        task = asyncio.create_task(self.restore(guild, action, targets))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    async def bounded(self: "RestorePipeline", guild: Guild, coro) -> Any:
+        async with self.semaphores[guild.id]:
+            try:
+                return await coro
+            except HTTPException:
+                logger.exception(f"Unable to restore a deleted object in {guild.id}")
+
+    async def restore_role(
+        self: "RestorePipeline", guild: Guild, snapshot: RoleSnapshot
+    ) -> Role:
+        role = await guild.create_role(
+            name=snapshot.name,
+            permissions=Permissions(snapshot.permissions),
+            colour=Colour(snapshot.color),
+            hoist=snapshot.hoist,
+            mentionable=snapshot.mentionable,
+            reason=REASON,
+        )
+        self.store(self.remapped, guild.id, Remapped(snapshot.id, role))
+        return role
+
+    async def restore_channel(
+        self: "RestorePipeline", guild: Guild, snapshot: ChannelSnapshot
+    ) -> GuildChannel:
+        overwrites = {}
+        for target_id, is_role, allow, deny in snapshot.overwrites:
+            target = (
+                self.remap(guild.id, target_id) or guild.get_role(target_id)
+                if is_role
+                else guild.get_member(target_id) or Object(target_id)
+            )
+            if target:
+                overwrites[target] = PermissionOverwrite.from_pair(
+                    Permissions(allow), Permissions(deny)
+                )
+
+        kwargs = dict(
+            name=snapshot.name,
+            position=snapshot.position,
+            overwrites=overwrites,
+            reason=REASON,
+            **snapshot.options,
+        )
+
+        if snapshot.type == ChannelType.category:
+            channel = await guild.create_category(**kwargs)
+        else:
+            kwargs["category"] = self.remap(
+                guild.id, snapshot.category_id
+            ) or guild.get_channel(snapshot.category_id)
+
+            match snapshot.type:
+                case ChannelType.voice:
+                    channel = await guild.create_voice_channel(**kwargs)
+                case ChannelType.stage_voice:
+                    channel = await guild.create_stage_channel(**kwargs)
+                case ChannelType.forum:
+                    channel = await guild.create_forum(**kwargs)
+                case _:
+                    channel = await guild.create_text_channel(**kwargs)
+
+        self.store(self.remapped, guild.id, Remapped(snapshot.id, channel))
+        return channel
+
+    async def restore(
+        self: "RestorePipeline", guild: Guild, action: str, targets: List[Any]
+    ) -> int:
+        ids = [t.id for t in targets if t]
+
+        if action == "role_delete":
+            snapshots = await self.take(self.roles, guild.id, ids)
+            roles = await asyncio.gather(
+                *(self.bounded(guild, self.restore_role(guild, s)) for s in snapshots)
+            )
+
+            if positions := {
+                role: max(s.position, 1) for s, role in zip(snapshots, roles) if role
+            }:
+                await self.bounded(
+                    guild, guild.edit_role_positions(positions, reason=REASON)
+                )
+
+            return len(positions)
+
+        if action == "channel_delete":
+            snapshots = await self.take(self.channels, guild.id, ids)
+            restored = 0
+
+            # categories first so their children can be nested back into them
+            for batch in (
+                [s for s in snapshots if s.type == ChannelType.category],
+                [s for s in snapshots if s.type != ChannelType.category],
+            ):
+                restored += sum(
+                    bool(channel)
+                    for channel in await asyncio.gather(
+                        *(
+                            self.bounded(guild, self.restore_channel(guild, s))
+                            for s in batch
+                        )
+                    )
+                )
+
+            return restored
+
+        return 0
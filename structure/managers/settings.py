@@ -0,0 +1,198 @@
+import re
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set
+
+from discord import Permissions
+
+from .database import Record
+
+if TYPE_CHECKING:
+    from structure.scare import Scare
+
+# tables read by the on_message listeners, mirrored per guild
+GUILD_TABLES = (
+    "server_settings",
+    "antispam",
+    "autoresponder",
+    "autoreact",
+)
+
+# trigger tables and the column handed back on a match
+TRIGGER_TABLES = {
+    "autoresponder": "response",
+    "autoreact": "reactions",
+}
+
+
+class Triggers:
+    __slots__ = ("strict", "loose", "pattern")
+
+    def __init__(self: "Triggers", records: List[Record], column: str):
+        self.strict: Dict[str, Any] = {}
+        self.loose: Dict[str, Any] = {}
+
+        for record in records:
+            inventory = self.strict if record.strict else self.loose
+            inventory.setdefault(record.trigger, record[column])
+
+        # longest first, so overlapping triggers prefer the most specific one
+        self.pattern: Optional[re.Pattern] = (
+            re.compile(
+                "|".join(
+                    map(re.escape, sorted(self.loose, key=len, reverse=True))
+                )
+            )
+            if self.loose
+            else None
+        )
+
+    def match(self: "Triggers", content: str) -> Optional[Any]:
+        if (value := self.strict.get(content)) is not None:
+            return value
+
+        if self.pattern and (match := self.pattern.search(content)):
+            return self.loose[match.group()]
+
+
+def permission_bits(permissions: Iterable[str]) -> int:
+    value = 0
+
+    for permission in permissions:
+        try:
+            value |= Permissions(**{permission: True}).value
+        except TypeError:
+            continue
+
+    return value
+
+
+class Settings:
+    def __init__(self: "Settings", bot: "Scare"):
+        self.bot = bot
+        self.tables: Dict[str, Dict[int, List[Record]]] = {
+            table: {} for table in GUILD_TABLES
+        }
+        self.triggers: Dict[str, Dict[int, Triggers]] = {
+            table: {} for table in TRIGGER_TABLES
+        }
+        self.lastfm_commands: Dict[int, str] = {}
+        self.reskins: Dict[int, Record] = {}
+        self.disabled_commands: Dict[int, Set[str]] = {}
+        self.fake_permissions: Dict[int, Dict[int, int]] = {}
+
+    def compile(self: "Settings", table: str, guild_id: int):
+        if not (column := TRIGGER_TABLES.get(table)):
+            return
+
+        if records := self.fetch(table, guild_id):
+            self.triggers[table][guild_id] = Triggers(records, column)
+        else:
+            self.triggers[table].pop(guild_id, None)
+
+    async def load(self: "Settings"):
+        for table in GUILD_TABLES:
+            inventory = self.tables[table] = {}
+            for record in await self.bot.db.fetch(f"SELECT * FROM {table}"):
+                inventory.setdefault(record.guild_id, []).append(record)
+
+            for guild_id in inventory:
+                self.compile(table, guild_id)
+
+        self.lastfm_commands = {
+            record.user_id: record.command
+            for record in await self.bot.db.fetch(
+                "SELECT user_id, command FROM lastfm.user WHERE command IS NOT NULL"
+            )
+        }
+
+        self.reskins = {
+            record.user_id: record
+            for record in await self.bot.db.fetch("SELECT * FROM reskin")
+        }
+
+        self.disabled_commands = {}
+        for record in await self.bot.db.fetch("SELECT * FROM disabledcmds"):
+            self.disabled_commands.setdefault(record.guild_id, set()).add(
+                record.command_name
+            )
+
+        self.fake_permissions = {}
+        for record in await self.bot.db.fetch("SELECT * FROM fakeperms"):
+            self.set_fake_permissions(
+                record.guild_id, record.role_id, record.permissions
+            )
+
+    async def refresh(self: "Settings", table: str, guild_id: int) -> List[Record]:
+        records = await self.bot.db.fetch(
+            f"SELECT * FROM {table} WHERE guild_id = $1", guild_id
+        )
+
+        if records:
+            self.tables[table][guild_id] = records
+        else:
+            self.tables[table].pop(guild_id, None)
+
+        self.compile(table, guild_id)
+        return records
+
+    async def refresh_lastfm(self: "Settings", user_id: int) -> Optional[str]:
+        if command := await self.bot.db.fetchval(
+            "SELECT command FROM lastfm.user WHERE user_id = $1", user_id
+        ):
+            self.lastfm_commands[user_id] = command
+        else:
+            self.lastfm_commands.pop(user_id, None)
+
+        return command
+
+    async def refresh_reskin(self: "Settings", user_id: int) -> Optional[Record]:
+        if record := await self.bot.db.fetchrow(
+            "SELECT * FROM reskin WHERE user_id = $1", user_id
+        ):
+            self.reskins[user_id] = record
+        else:
+            self.reskins.pop(user_id, None)
+
+        return record
+
+    def fetch(self: "Settings", table: str, guild_id: int) -> List[Record]:
+        return self.tables[table].get(guild_id, [])
+
+    def get(self: "Settings", table: str, guild_id: int) -> Optional[Record]:
+        if records := self.tables[table].get(guild_id):
+            return records[0]
+
+    def match(self: "Settings", table: str, guild_id: int, content: str) -> Any:
+        if triggers := self.triggers[table].get(guild_id):
+            return triggers.match(content)
+
+    def is_disabled(self: "Settings", guild_id: int, command: str) -> bool:
+        return command in self.disabled_commands.get(guild_id, ())
+
+    def disable_command(self: "Settings", guild_id: int, command: str):
+        self.disabled_commands.setdefault(guild_id, set()).add(command)
+
+    def enable_command(self: "Settings", guild_id: int, command: str):
+        if commands := self.disabled_commands.get(guild_id):
+            commands.discard(command)
+            if not commands:
+                del self.disabled_commands[guild_id]
+
+    def set_fake_permissions(
+        self: "Settings", guild_id: int, role_id: int, permissions: Iterable[str]
+    ):
+        if value := permission_bits(permissions):
+            self.fake_permissions.setdefault(guild_id, {})[role_id] = value
+        elif roles := self.fake_permissions.get(guild_id):
+            roles.pop(role_id, None)
+            if not roles:
+                del self.fake_permissions[guild_id]
+
+    def granted(self: "Settings", guild_id: int, role_ids: Iterable[int]) -> int:
+        if not (roles := self.fake_permissions.get(guild_id)):
+            return 0
+
+        value = 0
+        for role_id in role_ids:
+            value |= roles.get(role_id, 0)
+
+        return value
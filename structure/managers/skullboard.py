@@ -0,0 +1,263 @@
+import asyncio
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Optional, Set, Tuple
+
+from discord import (
+    Embed,
+    File,
+    HTTPException,
+    Message,
+    NotFound,
+    RawReactionActionEvent,
+)
+
+from . import logger as logging
+from .database import Record
+
+if TYPE_CHECKING:
+    from structure.scare import Scare
+
+logger = logging.getLogger(__name__)
+
+
+class SkullboardConfig:
+    __slots__ = ("guild_id", "channel_id", "emoji", "count")
+
+    def __init__(self, record: Record):
+        self.guild_id: int = record.guild_id
+        self.channel_id: Optional[int] = record.channel_id
+        self.emoji: Optional[str] = record.emoji
+        self.count: Optional[int] = record.count
+
+
+class SkullTally:
+    __slots__ = ("count", "exact", "handle")
+
+    def __init__(self, count: int, exact: bool):
+        self.count = count
+        # False while the count only covers reactions seen since startup
+        self.exact = exact
+        self.handle: Optional[asyncio.TimerHandle] = None
+
+
+class SkullboardEngine:
+    def __init__(
+        self: "SkullboardEngine", bot: "Scare", delay: float = 5, maxlen: int = 10000
+    ):
+        self.bot = bot
+        self.delay = delay
+        self.maxlen = maxlen
+        self.configs: Dict[int, SkullboardConfig] = {}
+        # message id -> (guild id, panel message id)
+        self.panels: Dict[int, Tuple[int, int]] = {}
+        self.panel_ids: Set[int] = set()
+        self.tallies: "OrderedDict[int, SkullTally]" = OrderedDict()
+        self.posting: Set[int] = set()
+        self.tasks: Set[asyncio.Task] = set()
+
+    async def load(self: "SkullboardEngine"):
+        self.configs = {
+            record.guild_id: SkullboardConfig(record)
+            for record in await self.bot.db.fetch("SELECT * FROM skullboard")
+        }
+        self.panels, self.panel_ids = {}, set()
+
+        for record in await self.bot.db.fetch("SELECT * FROM skullboard_message"):
+            self.panels[record.message_id] = (record.guild_id, record.panel_message_id)
+            self.panel_ids.add(record.panel_message_id)
+
+    async def refresh(self: "SkullboardEngine", guild_id: int):
+        if record := await self.bot.db.fetchrow(
+            "SELECT * FROM skullboard WHERE guild_id = $1", guild_id
+        ):
+            self.configs[guild_id] = SkullboardConfig(record)
+            return
+
+        self.configs.pop(guild_id, None)
+
+        for message_id in [m for m, (g, _) in self.panels.items() if g == guild_id]:
+            self.panel_ids.discard(self.panels.pop(message_id)[1])
+
+    def spawn(self: "SkullboardEngine", coro):
+        task = asyncio.create_task(coro)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    def tally(
+        self: "SkullboardEngine", payload: RawReactionActionEvent, delta: int
+    ) -> SkullTally:
+        if tally := self.tallies.get(payload.message_id):
+            tally.count = max(tally.count + delta, 0)
+            self.tallies.move_to_end(payload.message_id)
+            return tally
+
+        # discord.py has already applied this reaction to its own message cache
+        if message := self.bot._connection._get_message(payload.message_id):
+            tally = SkullTally(self.reaction_count(message, str(payload.emoji)), True)
+        else:
+            tally = SkullTally(max(delta, 0), False)
+
+        self.tallies[payload.message_id] = tally
+        if len(self.tallies) > self.maxlen:
+            _, evicted = self.tallies.popitem(last=False)
+            if evicted.handle:
+                evicted.handle.cancel()
+
+        return tally
+
+    @staticmethod
+    def reaction_count(message: Message, emoji: str) -> int:
+        return next((r.count for r in message.reactions if str(r.emoji) == emoji), 0)
+
+    def handle(self: "SkullboardEngine", payload: RawReactionActionEvent, delta: int):
+        config = self.configs.get(payload.guild_id)
+        if not config or not config.channel_id or str(payload.emoji) != config.emoji:
+            return
+
+        if payload.message_id in self.panel_ids:
+            return
+
+        tally = self.tally(payload, delta)
+
+        if payload.message_id in self.panels:
+            self.schedule(payload, tally)
+        elif (
+            delta > 0
+            and config.count
+            # an inexact tally is seeded once by the posting task, which
+            # re-reads the message before comparing it to the threshold
+            and (tally.count >= config.count or not tally.exact)
+            and payload.message_id not in self.posting
+        ):
+            self.posting.add(payload.message_id)
+            self.spawn(self.post(payload, config, tally))
+
+    def schedule(
+        self: "SkullboardEngine", payload: RawReactionActionEvent, tally: SkullTally
+    ):
+        # one edit per window carries every reaction that landed in it
+        if not tally.handle:
+            tally.handle = asyncio.get_running_loop().call_later(
+                self.delay, lambda: self.spawn(self.edit(payload))
+            )
+
+    async def edit(self: "SkullboardEngine", payload: RawReactionActionEvent):
+        if not (tally := self.tallies.get(payload.message_id)):
+            return
+
+        tally.handle = None
+
+        if not (panel := self.panels.get(payload.message_id)):
+            return
+
+        if not (config := self.configs.get(payload.guild_id)):
+            return
+
+        if not (channel := self.bot.get_channel(config.channel_id)):
+            return
+
+        try:
+            if not tally.exact:
+                message = await self.bot.get_partial_messageable(
+                    payload.channel_id
+                ).fetch_message(payload.message_id)
+                tally.count, tally.exact = (
+                    self.reaction_count(message, str(payload.emoji)),
+                    True,
+                )
+
+            await channel.get_partial_message(panel[1]).edit(
+                content=f"**#{tally.count}** {payload.emoji}"
+            )
+        except NotFound:
+            # the panel or the original message is gone, stop tracking it
+            self.panels.pop(payload.message_id, None)
+            self.panel_ids.discard(panel[1])
+            await self.bot.db.execute(
+                "DELETE FROM skullboard_message WHERE message_id = $1",
+                payload.message_id,
+            )
+        except HTTPException:
+            logger.warning(f"Unable to edit skullboard panel {panel[1]}")
+
+    async def post(
+        self: "SkullboardEngine",
+        payload: RawReactionActionEvent,
+        config: SkullboardConfig,
+        tally: SkullTally,
+    ):
+        try:
+            if not (channel := self.bot.get_channel(config.channel_id)):
+                return
+
+            if not (source := self.bot.get_channel(payload.channel_id)):
+                return
+
+            try:
+                message = await source.fetch_message(payload.message_id)
+            except NotFound:
+                # the message is gone, later reactions shouldn't fetch it again
+                tally.exact = True
+                return
+
+            count = tally.count = self.reaction_count(message, str(payload.emoji))
+            tally.exact = True
+
+            if count < config.count:
+                return
+
+            if not (message.content or message.attachments):
+                return
+
+            desc = message.content
+            if ref := getattr(message.reference, "resolved", None):
+                desc += f"\nReplying to [{ref.author}]({ref.jump_url})"
+
+            embed = Embed(
+                color=self.bot.color,
+                description=desc,
+                title=f"#{message.channel}",
+                url=message.jump_url,
+                timestamp=message.created_at,
+            )
+
+            file: Optional[File] = None
+            if len(message.attachments) > 0:
+                attachment = message.attachments[0]
+                if attachment.filename.endswith(("png", "gif", "jpeg", "jpg")):
+                    embed.set_image(url=attachment.url)
+                elif attachment.filename.endswith(("mp4", "mov")):
+                    file = File(
+                        await self.bot.urltobyte(attachment.url),
+                        filename=attachment.filename,
+                    )
+
+            embed.set_author(
+                name=str(message.author), icon_url=message.author.display_avatar.url
+            )
+
+            panel = await channel.send(
+                content=f"**#{count}** {payload.emoji}", embed=embed, file=file
+            )
+            self.panels[payload.message_id] = (payload.guild_id, panel.id)
+            self.panel_ids.add(panel.id)
+
+            # reactions that landed while the panel was being posted
+            if tally.count != count:
+                self.schedule(payload, tally)
+
+            await self.bot.db.execute(
+                """
+                INSERT INTO skullboard_message VALUES ($1,$2,$3,$4)
+                ON CONFLICT (guild_id, channel_id, message_id)
+                DO UPDATE SET panel_message_id = $4
+                """,
+                payload.guild_id,
+                payload.channel_id,
+                payload.message_id,
+                panel.id,
+            )
+        except HTTPException:
+            logger.warning(f"Unable to post {payload.message_id} to the skullboard")
+        finally:
+            self.posting.discard(payload.message_id)
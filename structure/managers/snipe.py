@@ -0,0 +1,188 @@
+import json
+import sys
+import time
+from collections import OrderedDict, deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional, Tuple, Union
+
+from discord import Member, Message, Reaction, User
+from discord.utils import utcnow
+
+
+def sizeof(*values) -> int:
+    return sum(map(sys.getsizeof, values))
+
+
+class Snipe:
+    __slots__ = (
+        "content",
+        "author_id",
+        "author_name",
+        "avatar_url",
+        "attachments",
+        "content_types",
+        "timestamp",
+        "embeds",
+        "stored",
+        "size",
+    )
+
+    def __init__(
+        self,
+        content: str,
+        author_id: int,
+        author_name: str,
+        avatar_url: str,
+        attachments: Tuple[str, ...],
+        timestamp: datetime,
+        embeds: Tuple[Dict[str, Any], ...] = (),
+        content_types: Tuple[Optional[str], ...] = (),
+    ):
+        self.content = content
+        self.author_id = author_id
+        self.author_name = author_name
+        self.avatar_url = avatar_url
+        self.attachments = attachments
+        # aligned with `attachments`, None where Discord sent no type
+        self.content_types = content_types
+        self.timestamp = timestamp
+        # raw embed payloads, rebuilt with Embed.from_dict when sniped
+        self.embeds = embeds
+        self.stored = time.monotonic()
+        self.size = sizeof(
+            self, content, author_name, avatar_url, attachments, *attachments
+        ) + sum(len(json.dumps(embed, default=str)) for embed in embeds)
+
+    @property
+    def mention(self) -> str:
+        return f"<@{self.author_id}>"
+
+    @classmethod
+    def from_message(
+        cls, message: Message, timestamp: Optional[datetime] = None
+    ) -> "Snipe":
+        return cls(
+            content=message.content,
+            author_id=message.author.id,
+            author_name=message.author.name,
+            avatar_url=message.author.display_avatar.url,
+            attachments=tuple(
+                [a.url for a in message.attachments]
+                + [s.url for s in message.stickers]
+            ),
+            content_types=tuple(
+                [a.content_type for a in message.attachments]
+                + [None for _ in message.stickers]
+            ),
+            timestamp=timestamp or message.created_at,
+            # the snipe embed is sent first, so there is room for nine more
+            embeds=tuple(embed.to_dict() for embed in message.embeds[:9]),
+        )
+
+
+class EditSnipe(Snipe):
+    __slots__ = ("before",)
+
+    def __init__(self, before: str, *args, **kwargs):
+        self.before = before
+        super().__init__(*args, **kwargs)
+        self.size += sizeof(before)
+
+    @classmethod
+    def from_messages(cls, before: Message, after: Message) -> "EditSnipe":
+        return cls(
+            before.content,
+            content=after.content,
+            author_id=after.author.id,
+            author_name=after.author.name,
+            avatar_url=after.author.display_avatar.url,
+            attachments=(),
+            timestamp=after.edited_at or utcnow(),
+        )
+
+
+class ReactionSnipe(Snipe):
+    __slots__ = ("emoji", "jump_url")
+
+    def __init__(self, emoji: str, jump_url: str, *args, **kwargs):
+        self.emoji = emoji
+        self.jump_url = jump_url
+        super().__init__(*args, **kwargs)
+        self.size += sizeof(emoji, jump_url)
+
+    @classmethod
+    def from_reaction(
+        cls, reaction: Reaction, user: Union[Member, User]
+    ) -> "ReactionSnipe":
+        return cls(
+            str(reaction.emoji),
+            reaction.message.jump_url,
+            content="",
+            author_id=user.id,
+            author_name=user.name,
+            avatar_url=user.display_avatar.url,
+            attachments=(),
+            timestamp=utcnow(),
+        )
+
+
+class SnipeStore:
+    def __init__(
+        self,
+        maxlen: int = 50,
+        budget: int = 32 * 1024 * 1024,
+        expiring: int = 3600 * 2,
+    ):
+        self.maxlen = maxlen
+        self.budget = budget
+        self.expiring = expiring
+        self.size = 0
+        # least recently written channel first, so the budget evicts stale ones
+        self.channels: "OrderedDict[Tuple[str, int], Deque[Snipe]]" = OrderedDict()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            "channels": len(self.channels),
+            "records": sum(map(len, self.channels.values())),
+            "bytes": self.size,
+            "budget": self.budget,
+        }
+
+    def evict(self, key: Tuple[str, int]) -> Snipe:
+        records = self.channels[key]
+        record = records.popleft()
+        self.size -= record.size
+
+        if not records:
+            del self.channels[key]
+
+        return record
+
+    def push(self, kind: str, channel_id: int, record: Snipe):
+        key = (kind, channel_id)
+
+        if not (records := self.channels.get(key)):
+            records = self.channels[key] = deque()
+        elif len(records) >= self.maxlen:
+            self.evict(key)
+
+        records.append(record)
+        self.channels.move_to_end(key)
+        self.size += record.size
+
+        while self.size > self.budget and self.channels:
+            self.evict(next(iter(self.channels)))
+
+    def get(self, kind: str, channel_id: int) -> List[Snipe]:
+        key = (kind, channel_id)
+        threshold = time.monotonic() - self.expiring
+
+        while (records := self.channels.get(key)) and records[0].stored < threshold:
+            self.evict(key)
+
+        return list(records or [])
+
+    def clear(self, kind: str, channel_id: int):
+        for record in self.channels.pop((kind, channel_id), []):
+            self.size -= record.size
@@ -0,0 +1,163 @@
+import asyncio
+import time
+from collections import defaultdict
+from contextlib import suppress
+from typing import TYPE_CHECKING, Dict, Optional, Set
+
+from discord import HTTPException, Member, Message
+
+from . import logger as logging
+
+if TYPE_CHECKING:
+    from structure.scare import Scare
+
+logger = logging.getLogger(__name__)
+
+
+class Sticky:
+    __slots__ = (
+        "guild_id",
+        "channel_id",
+        "message_id",
+        "message",
+        "author",
+        "handle",
+        "since",
+    )
+
+    def __init__(
+        self, guild_id: int, channel_id: int, message_id: int, message: str
+    ):
+        self.guild_id = guild_id
+        self.channel_id = channel_id
+        self.message_id = message_id
+        self.message = message
+        self.author: Optional[Member] = None
+        self.handle: Optional[asyncio.TimerHandle] = None
+        self.since: Optional[float] = None
+
+    def cancel(self):
+        if self.handle:
+            self.handle.cancel()
+
+        self.handle = self.since = None
+
+
+class StickyMessages:
+    def __init__(
+        self: "StickyMessages", bot: "Scare", delay: float = 3, maxdelay: float = 15
+    ):
+        self.bot = bot
+        self.delay = delay
+        self.maxdelay = maxdelay
+        self.channels: Dict[int, Sticky] = {}
+        self.locks: Dict[int, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self.tasks: Set[asyncio.Task] = set()
+
+    async def load(self: "StickyMessages"):
+        self.channels = {
+            record.channel_id: Sticky(*record)
+            for record in await self.bot.db.fetch(
+                "SELECT guild_id, channel_id, message_id, message FROM sticky_message"
+            )
+        }
+
+    def get(self: "StickyMessages", channel_id: int) -> Optional[Sticky]:
+        return self.channels.get(channel_id)
+
+    def add(
+        self: "StickyMessages",
+        guild_id: int,
+        channel_id: int,
+        message_id: int,
+        message: str,
+    ):
+        self.remove(channel_id)
+        self.channels[channel_id] = Sticky(guild_id, channel_id, message_id, message)
+
+    def remove(self: "StickyMessages", channel_id: int) -> Optional[Sticky]:
+        if sticky := self.channels.pop(channel_id, None):
+            sticky.cancel()
+
+        return sticky
+
+    def clear(self: "StickyMessages", guild_id: int):
+        for channel_id in [
+            c for c, s in self.channels.items() if s.guild_id == guild_id
+        ]:
+            self.remove(channel_id)
+
+    def spawn(self: "StickyMessages", coro):
+        task = asyncio.create_task(coro)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    def schedule(self: "StickyMessages", message: Message):
+        if not (sticky := self.channels.get(message.channel.id)):
+            return
+
+        if message.author.id == self.bot.user.id or message.id == sticky.message_id:
+            return
+
+        now = time.monotonic()
+        sticky.author = message.author
+
+        if sticky.handle:
+            # a busy channel still gets a repost once maxdelay has passed
+            if now - sticky.since >= self.maxdelay:
+                return
+
+            sticky.handle.cancel()
+        else:
+            sticky.since = now
+
+        sticky.handle = asyncio.get_running_loop().call_later(
+            min(self.delay, sticky.since + self.maxdelay - now),
+            lambda: self.spawn(self.repost(sticky)),
+        )
+
+    async def repost(self: "StickyMessages", sticky: Sticky):
+        author, sticky.author = sticky.author, None
+        sticky.handle = sticky.since = None
+
+        async with self.locks[sticky.channel_id]:
+            if self.channels.get(sticky.channel_id) is not sticky:
+                return
+
+            if not (channel := self.bot.get_channel(sticky.channel_id)):
+                return
+
+            with suppress(HTTPException):
+                await channel.get_partial_message(sticky.message_id).delete()
+
+            try:
+                code = await self.bot.embed.convert(
+                    author or channel.guild.me, sticky.message
+                )
+                code.pop("delete_after", None)
+                message = await channel.send(**code)
+            except HTTPException:
+                return
+            except Exception:
+                return logger.exception(
+                    f"Unable to repost the sticky message in {sticky.channel_id}"
+                )
+
+            sticky.message_id = message.id
+            self.spawn(self.persist(sticky))
+
+    async def persist(self: "StickyMessages", sticky: Sticky):
+        try:
+            await self.bot.db.execute(
+                """
+                UPDATE sticky_message SET message_id = $1
+                WHERE guild_id = $2 AND channel_id = $3
+                """,
+                sticky.message_id,
+                sticky.guild_id,
+                sticky.channel_id,
+            )
+        except Exception:
+            logger.exception(
+                f"Unable to persist the sticky message in {sticky.channel_id}"
+            )
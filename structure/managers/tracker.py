@@ -0,0 +1,117 @@
+import asyncio
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, List, Optional, Set
+
+from discord import HTTPException
+
+from . import logger as logging
+from .ratelimit import ratelimiter
+
+if TYPE_CHECKING:
+    from structure.scare import Scare
+
+logger = logging.getLogger(__name__)
+
+TRACKERS = ("username", "vanity")
+
+
+class TrackerBroadcaster:
+    def __init__(
+        self: "TrackerBroadcaster",
+        bot: "Scare",
+        delay: float = 5,
+        concurrency: int = 10,
+        maxlen: int = 100,
+    ):
+        self.bot = bot
+        self.delay = delay
+        self.concurrency = concurrency
+        self.maxlen = maxlen
+        # tracker -> guild id -> channel id
+        self.subscribers: Dict[str, Dict[int, int]] = {t: {} for t in TRACKERS}
+        self.pending: Dict[str, List[str]] = {t: [] for t in TRACKERS}
+        self.handles: Dict[str, asyncio.TimerHandle] = {}
+        # channel id -> lines not delivered yet, so a backlog merges into one digest
+        self.outbox: "OrderedDict[int, List[str]]" = OrderedDict()
+        self.workers: Set[asyncio.Task] = set()
+
+    async def load(self: "TrackerBroadcaster"):
+        for tracker in TRACKERS:
+            self.subscribers[tracker] = {
+                record.guild_id: record.channel_id
+                for record in await self.bot.db.fetch(
+                    f"SELECT guild_id, channel_id FROM tracker.{tracker}"
+                )
+            }
+
+    def subscribe(
+        self: "TrackerBroadcaster", tracker: str, guild_id: int, channel_id: int
+    ):
+        self.subscribers[tracker][guild_id] = channel_id
+
+    def unsubscribe(self: "TrackerBroadcaster", tracker: str, guild_id: int):
+        self.subscribers[tracker].pop(guild_id, None)
+
+    def publish(self: "TrackerBroadcaster", tracker: str, line: str):
+        if not self.subscribers[tracker]:
+            return
+
+        self.pending[tracker].append(line)
+
+        if tracker not in self.handles:
+            self.handles[tracker] = asyncio.get_running_loop().call_later(
+                self.delay, self.flush, tracker
+            )
+
+    def flush(self: "TrackerBroadcaster", tracker: str):
+        self.handles.pop(tracker, None)
+        lines = list(dict.fromkeys(self.pending[tracker]))
+        self.pending[tracker] = []
+
+        for channel_id in self.subscribers[tracker].values():
+            queued = self.outbox.setdefault(channel_id, [])
+            queued.extend(lines)
+            del queued[: -self.maxlen]
+
+        while len(self.workers) < min(self.concurrency, len(self.outbox)):
+            task = asyncio.create_task(self.work())
+            self.workers.add(task)
+            task.add_done_callback(self.workers.discard)
+
+    async def work(self: "TrackerBroadcaster"):
+        while self.outbox:
+            channel_id, lines = self.outbox.popitem(last=False)
+
+            if not (channel := self.bot.get_channel(channel_id)):
+                continue
+
+            for content in self.digest(lines):
+                # stay under the channel's message route limit of 5 per 5 seconds
+                if retry := ratelimiter(
+                    bucket="tracker", key=channel_id, rate=5, per=5
+                ):
+                    await asyncio.sleep(retry)
+
+                try:
+                    await channel.send(content)
+                except HTTPException:
+                    logger.debug(f"Unable to deliver a tracker digest to {channel_id}")
+                    break
+
+    @staticmethod
+    def digest(lines: List[str], limit: int = 2000) -> List[str]:
+        messages: List[str] = []
+        current: Optional[str] = None
+
+        for line in lines:
+            if current and len(current) + len(line) + 1 <= limit:
+                current += f"\n{line}"
+            else:
+                if current:
+                    messages.append(current)
+                current = line[:limit]
+
+        if current:
+            messages.append(current)
+
+        return messages
@@ -0,0 +1,61 @@
+import asyncio
+from collections import Counter
+from typing import TYPE_CHECKING
+
+from discord.ext import tasks
+
+from . import logger as logging
+
+if TYPE_CHECKING:
+    from structure.scare import Scare
+
+logger = logging.getLogger(__name__)
+
+
+class CommandUsage:
+    def __init__(self: "CommandUsage", bot: "Scare", interval: float = 30):
+        self.bot = bot
+        self.pending: Counter = Counter()
+        self.lock = asyncio.Lock()
+        self.flusher.change_interval(seconds=interval)
+
+    @property
+    def unflushed(self: "CommandUsage") -> int:
+        return sum(self.pending.values())
+
+    def increment(self: "CommandUsage", name: str, count: int = 1):
+        self.pending[name] += count
+
+    async def flush(self: "CommandUsage"):
+        async with self.lock:
+            if not self.pending:
+                return
+
+            pending, self.pending = self.pending, Counter()
+
+            try:
+                await self.bot.db.execute(
+                    """
+                    INSERT INTO topcmds (name, count)
+                    SELECT * FROM UNNEST($1::TEXT[], $2::INTEGER[])
+                    ON CONFLICT (name)
+                    DO UPDATE SET count = topcmds.count + EXCLUDED.count
+                    """,
+                    list(pending.keys()),
+                    list(pending.values()),
+                )
+            except Exception:
+                # keep the increments around for the next flush
+                self.pending.update(pending)
+                logger.exception("Unable to flush command usage")
+
+    @tasks.loop(seconds=30)
+    async def flusher(self: "CommandUsage"):
+        await self.flush()
+
+    def start(self: "CommandUsage"):
+        self.flusher.start()
+
+    async def stop(self: "CommandUsage"):
+        self.flusher.cancel()
+        await self.flush()
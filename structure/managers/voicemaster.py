@@ -0,0 +1,90 @@
+from typing import TYPE_CHECKING, Dict, Optional, Set
+
+if TYPE_CHECKING:
+    from structure.scare import Scare
+
+
+class VoiceMasterRegistry:
+    def __init__(self: "VoiceMasterRegistry", bot: "Scare"):
+        self.bot = bot
+        # guild id -> join to create channel id
+        self.join: Dict[int, int] = {}
+        # guild id -> temporary channel ids
+        self.channels: Dict[int, Set[int]] = {}
+        # temporary channel id -> owner id
+        self.owners: Dict[int, int] = {}
+
+    async def load(self: "VoiceMasterRegistry"):
+        self.join = {
+            record.guild_id: record.channel_id
+            for record in await self.bot.db.fetch(
+                "SELECT guild_id, channel_id FROM voicemaster"
+            )
+        }
+        self.channels, self.owners = {}, {}
+
+        for record in await self.bot.db.fetch(
+            "SELECT guild_id, channel_id, owner_id FROM voicemaster_channels"
+        ):
+            self.channels.setdefault(record.guild_id, set()).add(record.channel_id)
+            self.owners[record.channel_id] = record.owner_id
+
+    def configure(self: "VoiceMasterRegistry", guild_id: int, channel_id: int):
+        self.join[guild_id] = channel_id
+
+    async def disable(self: "VoiceMasterRegistry", guild_id: int) -> Set[int]:
+        self.join.pop(guild_id, None)
+        channels = self.channels.pop(guild_id, set())
+
+        for channel_id in channels:
+            self.owners.pop(channel_id, None)
+
+        await self.bot.db.execute(
+            "DELETE FROM voicemaster_channels WHERE guild_id = $1", guild_id
+        )
+        return channels
+
+    def owner(self: "VoiceMasterRegistry", channel_id: int) -> Optional[int]:
+        return self.owners.get(channel_id)
+
+    def is_temporary(self: "VoiceMasterRegistry", channel_id: int) -> bool:
+        return channel_id in self.owners
+
+    async def add(
+        self: "VoiceMasterRegistry", guild_id: int, channel_id: int, owner_id: int
+    ):
+        self.channels.setdefault(guild_id, set()).add(channel_id)
+        self.owners[channel_id] = owner_id
+
+        await self.bot.db.execute(
+            """
+            INSERT INTO voicemaster_channels (guild_id, channel_id, owner_id)
+            VALUES ($1, $2, $3) ON CONFLICT (channel_id)
+            DO UPDATE SET owner_id = $3
+            """,
+            guild_id,
+            channel_id,
+            owner_id,
+        )
+
+    async def remove(self: "VoiceMasterRegistry", guild_id: int, channel_id: int):
+        if self.owners.pop(channel_id, None) is None:
+            return
+
+        if channels := self.channels.get(guild_id):
+            channels.discard(channel_id)
+            if not channels:
+                del self.channels[guild_id]
+
+        await self.bot.db.execute(
+            "DELETE FROM voicemaster_channels WHERE channel_id = $1", channel_id
+        )
+
+    async def claim(self: "VoiceMasterRegistry", channel_id: int, owner_id: int):
+        self.owners[channel_id] = owner_id
+
+        await self.bot.db.execute(
+            "UPDATE voicemaster_channels SET owner_id = $1 WHERE channel_id = $2",
+            owner_id,
+            channel_id,
+        )
@@ -0,0 +1,60 @@
+import asyncio
+import time
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict
+
+from discord import TextChannel, Webhook
+
+if TYPE_CHECKING:
+    from structure.scare import Scare
+
+
+class WebhookPool:
+    def __init__(self: "WebhookPool", bot: "Scare", grace: float = 5):
+        self.bot = bot
+        self.grace = grace
+        self.webhooks: Dict[int, Webhook] = {}
+        self.locks: Dict[int, asyncio.Lock] = defaultdict(asyncio.Lock)
+        # channel id -> when the webhooks update caused by our own create is over
+        self.created: Dict[int, float] = {}
+
+    async def get(self: "WebhookPool", channel: TextChannel) -> Webhook:
+        if webhook := self.webhooks.get(channel.id):
+            return webhook
+
+        # concurrent sends in a fresh channel would each create a webhook
+        async with self.locks[channel.id]:
+            if webhook := self.webhooks.get(channel.id):
+                return webhook
+
+            if not (
+                webhook := next(
+                    (
+                        w
+                        for w in await channel.webhooks()
+                        if w.user and w.user.id == self.bot.user.id
+                    ),
+                    None,
+                )
+            ):
+                webhook = await channel.create_webhook(
+                    name=f"{self.bot.user.name} - reskin"
+                )
+                self.created[channel.id] = time.monotonic() + self.grace
+
+            self.webhooks[channel.id] = webhook
+            return webhook
+
+    def evict(self: "WebhookPool", channel_id: int):
+        self.webhooks.pop(channel_id, None)
+
+        # a held lock is still guarding a fetch or create for this channel
+        if (lock := self.locks.get(channel_id)) and not lock.locked():
+            del self.locks[channel_id]
+
+    def updated(self: "WebhookPool", channel_id: int):
+        # our own create fires a webhooks update, the cached webhook is still valid
+        if self.created.pop(channel_id, 0) > time.monotonic():
+            return
+
+        self.evict(channel_id)
@@ -1,8 +1,12 @@
 import asyncio
 import base64
 import json
+import threading
+import time
 import uuid
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, partial
+from typing import List, Optional, Union
 
 import tls_client
 from pydantic import BaseModel
@@ -41,17 +45,49 @@ class User(BaseModel):
 
 
 class Workers:
-    def __init__(self, workers: list, captcha_key: str):
-        self.workers = workers
+    def __init__(
+        self,
+        workers: list,
+        captcha_key: str,
+        threads: int = 4,
+        parallelism: int = 4,
+        cookie_ttl: int = 1800,
+    ):
+        self.workers: List[Union[str, User]] = workers
         self.captcha_key = captcha_key
         self.useragent = "Mozilla/5.0 (Windows NT 10.0; WOW64) AppleWebKit/537.36 (KHTML, like Gecko) discord/1.0.9024 Chrome/108.0.5359.215 Electron/22.3.26 Safari/537.36"
-        self.session = tls_client.Session(
-            client_identifier="firefox_120", random_tls_extension_order=False
+        # tls_client is blocking, so every call runs on this bounded pool
+        self.executor = ThreadPoolExecutor(
+            max_workers=threads, thread_name_prefix="workers"
         )
+        self.local = threading.local()
+        self.parallelism = parallelism
+        self.cookie_ttl = cookie_ttl
+        self.cookies: Optional[str] = None
+        self.cookies_expire = 0.0
+        self.cookies_lock = asyncio.Lock()
         self.cache = {}
         self.guild_count = 0
 
     @property
+    def session(self) -> tls_client.Session:
+        # one session per pool thread, they are reused across requests
+        if not (session := getattr(self.local, "session", None)):
+            session = self.local.session = tls_client.Session(
+                client_identifier="firefox_120", random_tls_extension_order=False
+            )
+
+        return session
+
+    def _request(self, method: str, url: str, **kwargs):
+        return getattr(self.session, method)(url, **kwargs)
+
+    async def request(self, method: str, url: str, **kwargs):
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor, partial(self._request, method, url, **kwargs)
+        )
+
+    @cached_property
     def properties(self) -> str:
         payload = {
             "os": "Windows",
@@ -72,21 +108,29 @@ class Workers:
 
         return base64.b64encode(json.dumps(payload).encode()).decode()
 
-    def get_cookies(self) -> str:
-        req = self.session.get("https://discord.com")
-        if req.status_code == 200:
-            return (
-                "; ".join([f"{cookie.name}={cookie.value}" for cookie in req.cookies])
-                + "; locale=en-US"
-            )
-        else:
-            return "__dcfduid=4e0a8d504a4411eeb88f7f88fbb5d20a; __sdcfduid=4e0a8d514a4411eeb88f7f88fbb5d20ac488cd4896dae6574aaa7fbfb35f5b22b405bbd931fdcb72c21f85b263f61400; __cfruid=f6965e2d30c244553ff3d4203a1bfdabfcf351bd-1699536665; _cfuvid=rNaPQ7x_qcBwEhO_jNgXapOMoUIV2N8FA_8lzPV89oM-1699536665234-0-604800000; locale=en-US"
+    async def get_cookies(self) -> str:
+        async with self.cookies_lock:
+            if self.cookies and self.cookies_expire > time.monotonic():
+                return self.cookies
+
+            req = await self.request("get", "https://discord.com")
+            if req.status_code == 200:
+                self.cookies = (
+                    "; ".join(
+                        [f"{cookie.name}={cookie.value}" for cookie in req.cookies]
+                    )
+                    + "; locale=en-US"
+                )
+                self.cookies_expire = time.monotonic() + self.cookie_ttl
+                return self.cookies
 
-    def get_headers(self, token: str) -> dict:
+            return self.cookies or "__dcfduid=4e0a8d504a4411eeb88f7f88fbb5d20a; __sdcfduid=4e0a8d514a4411eeb88f7f88fbb5d20ac488cd4896dae6574aaa7fbfb35f5b22b405bbd931fdcb72c21f85b263f61400; __cfruid=f6965e2d30c244553ff3d4203a1bfdabfcf351bd-1699536665; _cfuvid=rNaPQ7x_qcBwEhO_jNgXapOMoUIV2N8FA_8lzPV89oM-1699536665234-0-604800000; locale=en-US"
+
+    async def get_headers(self, token: str) -> dict:
         return {
             "Accept-Language": "en-US,en;q=0.9",
             "Authorization": token,
-            "Cookie": self.get_cookies(),
+            "Cookie": await self.get_cookies(),
             "Content-Type": "application/json",
             "User-Agent": self.useragent,
             "X-Discord-Locale": "en-US",
@@ -94,10 +138,11 @@ class Workers:
             "X-Super-Properties": self.properties,
         }
 
-    def chunk(self, token: str):
-        r = self.session.get(
+    async def chunk(self, token: str):
+        r = await self.request(
+            "get",
             "https://discord.com/api/v9/users/@me/guilds",
-            headers=self.get_headers(token),
+            headers=await self.get_headers(token),
         )
 
         if r.status_code == 200:
@@ -106,9 +151,9 @@ class Workers:
         else:
             logger.info(f"{r.status_code} Unable to chunk guilds for {token[:7]}")
 
-    def __get_guild_from_invite(self, invite: str) -> Optional[Guild]:
-        r = self.session.get(
-            f"https://discord.com/api/invites/{invite}?with_counts=True"
+    async def __get_guild_from_invite(self, invite: str) -> Optional[Guild]:
+        r = await self.request(
+            "get", f"https://discord.com/api/invites/{invite}?with_counts=True"
         )
         if r.status_code == 200:
             data = r.json()
@@ -117,7 +162,8 @@ class Workers:
         return None
 
     async def get_captcha_token(self, task_id: str):
-        data = self.session.post(
+        data = await self.request(
+            "post",
             "https://api.capsolver.com/getTaskResult",
             headers={"Content-Type": "application/json"},
             json={"clientKey": self.captcha_key, "taskId": task_id},
@@ -136,7 +182,8 @@ class Workers:
             return None
 
     async def solve(self, sitekey: str, rqdata: str):
-        data = self.session.post(
+        data = await self.request(
+            "post",
             "https://api.capsolver.com/createTask",
             headers={"Content-Type": "application/json"},
             json={
@@ -161,12 +208,13 @@ class Workers:
     ):
         payload = {"session_id": uuid.uuid4().hex}
 
-        headers = self.get_headers(token)
+        headers = await self.get_headers(token)
 
         if h:
             headers.update(**h)
 
-        r = self.session.post(
+        r = await self.request(
+            "post",
             f"https://discord.com/api/v9/invites/{invite}",
             headers=headers,
             json=payload,
@@ -198,11 +246,11 @@ class Workers:
             return f"{r.status_code} - Unable to join {guild.name}"
 
     async def force_join(self, invite: str, token: str):
-        if guild := self.__get_guild_from_invite(invite):
+        if guild := await self.__get_guild_from_invite(invite):
             return await self.__join_guild(invite, token, guild)
 
     async def join(self, invite: str):
-        if guild := self.__get_guild_from_invite(invite):
+        if guild := await self.__get_guild_from_invite(invite):
             if any(
                 [
                     guild.id in self.cache[t]
@@ -225,26 +273,37 @@ class Workers:
         else:
             return "This is not a server.."
 
-    async def check_tokens(self):
-        for idx, token in enumerate(self.workers):
-            await asyncio.sleep(0.5)
-            r = self.session.get(
-                "https://discord.com/api/v9/users/@me", headers=self.get_headers(token)
+    async def check_token(
+        self, token: str, semaphore: asyncio.Semaphore
+    ) -> Optional[User]:
+        async with semaphore:
+            r = await self.request(
+                "get",
+                "https://discord.com/api/v9/users/@me",
+                headers=await self.get_headers(token),
             )
 
             if r.status_code != 200:
                 logger.info(f"token {token[:7]} is not available")
-                self.workers.remove(token)
-            else:
-                data = r.json()
-                payload = {
-                    "username": data["username"],
-                    "discriminator": data["discriminator"],
-                    "id": int(data["id"]),
-                    "token": token,
-                }
-                self.workers[idx] = User(**payload)
-                self.chunk(token)
+                return None
+
+            data = r.json()
+            payload = {
+                "username": data["username"],
+                "discriminator": data["discriminator"],
+                "id": int(data["id"]),
+                "token": token,
+            }
+            await self.chunk(token)
+            return User(**payload)
+
+    async def check_tokens(self):
+        semaphore = asyncio.Semaphore(self.parallelism)
+        tokens = [getattr(w, "token", w) for w in self.workers]
+        results = await asyncio.gather(
+            *[self.check_token(token, semaphore) for token in tokens]
+        )
+        self.workers = [user for user in results if user]
 
         guilds = []
         for chunked in self.cache.values():
@@ -267,3 +326,6 @@ class Workers:
         logger.info(
             f"Worker configured with {worker_count} worker{'s' if worker_count > 0 else ''} sharing {self.guild_count:,} servers"
         )
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
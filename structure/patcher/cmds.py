@@ -1,6 +1,6 @@
 from discord.ext import commands
 
-from structure.managers import Context
+from structure.managers import Context, permission_bits
 
 
 def ticket_moderator():
@@ -37,11 +37,8 @@ def antinuke_owner():
         if ctx.guild.owner_id == ctx.author.id:
             return True
 
-        if owners := await ctx.bot.db.fetchval(
-            "SELECT owners FROM antinuke WHERE guild_id = $1", ctx.guild.id
-        ):
-            if ctx.author.id in owners:
-                return True
+        if ctx.bot.antinuke.is_owner(ctx.guild.id, ctx.author.id):
+            return True
 
         await ctx.alert("You are not an antinuke owner")
         return False
@@ -100,29 +97,16 @@ def is_booster():
 
 
 def has_permissions(**perms: bool):
+    required = permission_bits(x for x, y in perms.items() if y)
+
     async def predicate(ctx: Context):
         if ctx.author.guild_permissions.administrator:
             return True
 
-        p = [x for x, y in perms.items() if y]
-
-        if any((getattr(ctx.author.guild_permissions, m) for m in p)):
+        if ctx.author.guild_permissions.value & required:
             return True
 
-        roles = ", ".join(map(lambda g: str(g.id), ctx.author.roles[1:]))
-
-        if not roles:
-            raise commands.MissingPermissions(perms)
-
-        results = await ctx.bot.db.fetch(
-            f"SELECT permissions FROM fakeperms WHERE guild_id = $1 AND role_id IN ({roles})",
-            ctx.guild.id,
-        )
-
-        flattened = list(
-            set(ctx.bot.flatten(list(map(lambda r: r.permissions, results))))
-        )
-        if any((g in flattened for g in p)):
+        if ctx.bot.settings.granted(ctx.guild.id, (r.id for r in ctx.author.roles)) & required:
             return True
 
         raise commands.MissingPermissions(perms)
@@ -41,15 +41,26 @@ from discord.ext.commands import (
     MissingRequiredFlag,
     NotOwner,
     UserInputError,
-    when_mentioned_or,
 )
 
 from structure.config import API, SCARE, ShardStatus
 from structure.managers import (
+    AntinukeSettings,
     Cache,
     ClientSession,
+    CommandUsage,
     Context,
     Help,
+    JoinPipeline,
+    LogDispatcher,
+    ReactionRoles,
+    Settings,
+    SkullboardEngine,
+    SnipeStore,
+    StickyMessages,
+    TrackerBroadcaster,
+    VoiceMasterRegistry,
+    WebhookPool,
     Workers,
     database,
     getLogger,
@@ -76,7 +87,7 @@ from datetime import timezone as date_timezone
 from io import BytesIO
 from os import environ
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from aiohttp.client_exceptions import ClientConnectorError, ClientResponseError
 from discord.utils import format_dt, oauth_url, utcnow
@@ -129,6 +140,18 @@ class Scare(AutoShardedBot):
         self.instance_owner_id = instance_owner_id
         self.color = color or 2829617
         self.cache = Cache()
+        self.settings = Settings(self)
+        self.antinuke = AntinukeSettings(self)
+        self.joins = JoinPipeline(self)
+        self.snipes = SnipeStore()
+        self.logs = LogDispatcher(self)
+        self.reactionroles = ReactionRoles(self)
+        self.skullboard = SkullboardEngine(self)
+        self.sticky = StickyMessages(self)
+        self.tracker = TrackerBroadcaster(self)
+        self.voicemaster = VoiceMasterRegistry(self)
+        self.webhooks = WebhookPool(self)
+        self.usage = CommandUsage(self)
         self.proxy = SCARE.proxy
         self.weather = API.weather
         self.captcha = SCARE.captcha
@@ -143,13 +166,22 @@ class Scare(AutoShardedBot):
         self.afk = {}
         self.reminder_tasks = {}
         self.giveaways = {}
-        self.prefixes = {}
+        self.blacklisted: Dict[int, str] = {}
+        self.listener = None
+        self.prefix = ","
+        self.prefixes: Dict[int, Tuple[str, ...]] = {}
+        self.default_prefixes: Tuple[str, ...] = (self.prefix,)
         self.bots = {}
         self.blacktea_matches = {}
         self.blackjack_matches = []
         self.invite_regex = r"(https?://)?(www.|canary.|ptb.)?(discord.gg|discordapp.com/invite|discord.com/invite)/?[a-zA-Z0-9]+/?"
 
     async def close(self):
+        await self.usage.stop()
+        self.workers.close()
+
+        if self.listener:
+            await self.db.release(self.listener)
         #await self.browser.close()
         #await self.session.close()
 
@@ -166,9 +198,19 @@ class Scare(AutoShardedBot):
         self.db = await database.connect(self.dbname)
         self.add_check(self.check_command)
 
-        blacklisted = await self.db.fetch("SELECT target_id FROM blacklist")
-        self.blacklisted = list(map(lambda r: r["target_id"], blacklisted))
+        await self.load_blacklist()
         self.tree.interaction_check = self.check_blacklisted
+        await self.settings.load()
+        await self.antinuke.load()
+        await self.joins.load()
+        await self.skullboard.load()
+        await self.sticky.load()
+        await self.tracker.load()
+        await self.logs.load()
+        await self.reactionroles.load()
+        await self.voicemaster.load()
+        await self.load_prefixes()
+        self.usage.start()
 
         afk = await self.db.fetch("SELECT * FROM afk")
         for a in afk:
@@ -188,6 +230,45 @@ class Scare(AutoShardedBot):
         self.add_view(TicketView())
         self.add_view(Giveaway())
 
+    async def load_blacklist(self: "Scare"):
+        self.blacklisted = {
+            record.target_id: record.target_type
+            for record in await self.db.fetch(
+                "SELECT target_id, target_type FROM blacklist"
+            )
+        }
+
+        # kept coherent with writes from any process through the table's trigger
+        self.listener = await self.db.acquire()
+        await self.listener.add_listener("blacklist", self.on_blacklist_notify)
+
+    def on_blacklist_notify(
+        self: "Scare", connection, pid: int, channel: str, payload: str
+    ):
+        data = json.loads(payload)
+
+        if data["op"] == "DELETE":
+            self.blacklisted.pop(data["target_id"], None)
+        else:
+            self.blacklisted[data["target_id"]] = data["target_type"]
+
+    def mention_prefixes(self: "Scare", prefix: str) -> Tuple[str, ...]:
+        return (f"<@{self.user.id}> ", f"<@!{self.user.id}> ", prefix)
+
+    def set_prefix(self: "Scare", guild_id: int, prefix: Optional[str]):
+        if prefix and prefix != self.prefix:
+            self.prefixes[guild_id] = self.mention_prefixes(prefix)
+        else:
+            self.prefixes.pop(guild_id, None)
+
+    async def load_prefixes(self: "Scare"):
+        # every custom prefix is preloaded, so a missing guild means the default
+        self.default_prefixes = self.mention_prefixes(self.prefix)
+        self.prefixes.clear()
+
+        for record in await self.db.fetch("SELECT guild_id, prefix FROM prefix"):
+            self.set_prefix(record.guild_id, record.prefix)
+
     async def bump_cycle(self, guild_id: int):
         if result := await self.db.fetchrow(
             "SELECT * FROM bumpreminder WHERE guild_id = $1", guild_id
@@ -304,14 +385,14 @@ class Scare(AutoShardedBot):
         return bool(ratelimit)
 
     async def check_blacklisted(self, interaction: Interaction):
-        objects = (interaction.user.id, getattr(interaction.guild, "id", 0))
-        result = await self.db.fetchrow(
-            f"SELECT * FROM blacklist WHERE target_id IN {objects}"
+        user_blacklisted = interaction.user.id in self.blacklisted
+        blacklisted = user_blacklisted or (
+            getattr(interaction.guild, "id", 0) in self.blacklisted
         )
-        if result:
+        if blacklisted:
             message = (
                 "You have been blacklisted from using scare."
-                if result.target_type == "user"
+                if user_blacklisted
                 else f"{interaction.guild} is blacklisted from using scare's commands."
             )
             await interaction.alert(
@@ -319,7 +400,7 @@ class Scare(AutoShardedBot):
             )
 
         cooldown = await self.has_cooldown(interaction)
-        return result is None and not cooldown
+        return not blacklisted and not cooldown
 
     async def leave_unauthorized(self):
         whitelisted = list(
@@ -643,16 +724,14 @@ class Scare(AutoShardedBot):
 
     async def process_commands(self: "Scare", message: Message):
         if message.guild:
-            if message.content.startswith(tuple(await bot_prefix(self, message))):
+            if message.content.startswith(bot_prefix(self, message)):
                 if not ratelimiter(
                     bucket=f"{message.channel.id}", key="globalratelimit", rate=3, per=3
                 ):
                     return await super().process_commands(message)
 
     async def on_guild_join(self, guild: Guild):
-        if await self.db.fetchrow(
-            "SELECT * FROM blacklist WHERE target_id = $1", guild.id
-        ):
+        if guild.id in self.blacklisted:
             return await guild.leave()
 
         if self.isinstance:
@@ -677,6 +756,10 @@ class Scare(AutoShardedBot):
 
                 return await guild.leave()
 
+    async def on_member_join(self: "Scare", member: Member):
+        # the feature handlers listen on join_pipeline instead of querying per join
+        self.joins.process(member)
+
     async def on_message_edit(self: "Scare", before: Message, after: Message):
         if before.content != after.content:
             await self.on_message(after)
@@ -685,16 +768,7 @@ class Scare(AutoShardedBot):
         return await super().get_context(message, cls=cls)
 
     async def on_command(self: "Scare", ctx: Context):
-        await self.db.execute(
-            """
-            INSERT INTO topcmds 
-            VALUES ($1,$2)
-            ON CONFLICT (name)
-            DO UPDATE SET count = topcmds.count + $2 
-            """,
-            ctx.command.qualified_name,
-            1,
-        )
+        self.usage.increment(ctx.command.qualified_name)
 
         if ctx.guild:
             self.logger.info(
@@ -774,15 +848,7 @@ class Scare(AutoShardedBot):
         if not ctx.guild:
             return True
 
-        if r := await self.db.fetchrow(
-            """
-            SELECT * FROM disabledcmds 
-            WHERE guild_id = $1 
-            AND command_name = $2
-            """,
-            ctx.guild.id,
-            ctx.command.qualified_name,
-        ):
+        if r := self.settings.is_disabled(ctx.guild.id, ctx.command.qualified_name):
             await ctx.alert(
                 f"**{ctx.command.qualified_name}** is disabled in this server"
             )
@@ -795,8 +861,13 @@ class Scare(AutoShardedBot):
             or message.author.bot
             or not message.guild
             or message.author.id in self.blacklisted
+            or message.guild.id in self.blacklisted
         )
 
+    async def on_webhooks_update(self: "Scare", channel):
+        # a webhook was created, edited or deleted; refetch on the next reskin send
+        self.webhooks.updated(channel.id)
+
     async def on_channel_delete(self, channel):
         if not self.isinstance:
             await self.db.execute(
@@ -815,17 +886,8 @@ class Scare(AutoShardedBot):
             await self.process_commands(message)
 
 
-async def bot_prefix(bot: Scare, message: Message):
-    if not (prefix := bot.prefixes.get(message.guild.id)):
-        prefix: str = (
-            await bot.db.fetchval(
-                "SELECT prefix FROM prefix WHERE guild_id = $1", message.guild.id
-            )
-            or ","
-        )
-        bot.prefixes[message.guild.id] = prefix
-
-    return when_mentioned_or(prefix)(bot, message)
+def bot_prefix(bot: Scare, message: Message) -> Tuple[str, ...]:
+    return bot.prefixes.get(getattr(message.guild, "id", None), bot.default_prefixes)
 
 
 @tasks.loop(minutes=10)
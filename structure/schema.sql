@@ -50,6 +50,18 @@ CREATE TABLE IF NOT EXISTS lastfm.crowns (
     PRIMARY KEY (artist)
 );
 
+CREATE TABLE IF NOT EXISTS lastfm.plays (
+    username TEXT NOT NULL,
+    artist TEXT NOT NULL,
+    name TEXT NOT NULL,
+    url TEXT,
+    plays BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (username, artist)
+);
+
+CREATE INDEX IF NOT EXISTS lastfm_plays_artist ON lastfm.plays (artist);
+
 CREATE TABLE IF NOT EXISTS afk (
     user_id BIGINT NOT NULL, 
     guild_id BIGINT NOT NULL, 
@@ -205,10 +217,25 @@ CREATE TABLE IF NOT EXISTS bumpreminder (
 CREATE TABLE IF NOT EXISTS voicemaster (
     guild_id BIGINT NOT NULL, 
     channel_id BIGINT NOT NULL, 
-    voice_channels JSON NOT NULL DEFAULT '{}'::JSON, 
+    voice_channels JSON NOT NULL DEFAULT '{}'::JSON,
     PRIMARY KEY (guild_id)
 );
 
+CREATE TABLE IF NOT EXISTS voicemaster_channels (
+    guild_id BIGINT NOT NULL,
+    channel_id BIGINT NOT NULL,
+    owner_id BIGINT NOT NULL,
+    PRIMARY KEY (channel_id)
+);
+
+INSERT INTO voicemaster_channels (guild_id, channel_id, owner_id)
+SELECT guild_id, key::BIGINT, value::BIGINT
+FROM voicemaster, json_each_text(voice_channels)
+ON CONFLICT (channel_id) DO NOTHING;
+
+UPDATE voicemaster SET voice_channels = '{}'::JSON
+WHERE voice_channels::TEXT <> '{}';
+
 CREATE TABLE IF NOT EXISTS whitelist (
     guild_id BIGINT NOT NULL,
     whitelisted BIGINT[] NOT NULL DEFAULT ARRAY[]::BIGINT[],
@@ -385,4 +412,26 @@ CREATE TABLE IF NOT EXISTS instances (
     status TEXT,
     activity TEXT,
     PRIMARY KEY (token)
-);
\ No newline at end of file
+);
+CREATE OR REPLACE FUNCTION notify_blacklist() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        PERFORM pg_notify(
+            'blacklist',
+            json_build_object('op', TG_OP, 'target_id', OLD.target_id, 'target_type', OLD.target_type)::TEXT
+        );
+        RETURN OLD;
+    END IF;
+
+    PERFORM pg_notify(
+        'blacklist',
+        json_build_object('op', TG_OP, 'target_id', NEW.target_id, 'target_type', NEW.target_type)::TEXT
+    );
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS blacklist_notify ON blacklist;
+CREATE TRIGGER blacklist_notify
+AFTER INSERT OR UPDATE OR DELETE ON blacklist
+FOR EACH ROW EXECUTE FUNCTION notify_blacklist();
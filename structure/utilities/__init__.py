@@ -1,3 +1,4 @@
+from .collage import *
 from .converter import *
 from .embed import *
 from .image import *
@@ -0,0 +1,213 @@
+import asyncio
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from aiohttp import ClientSession as Session
+from PIL import Image, ImageDraw, ImageFont
+
+from structure.managers import ClientSession, getLogger
+
+logger = getLogger(__name__)
+
+FONT_URL = "https://github.com/matomo-org/travis-scripts/raw/master/fonts/Arial.ttf"
+TILE = 250
+
+
+class CollageRenderer:
+    def __init__(
+        self: "CollageRenderer",
+        directory: str = "cache/collage",
+        threads: int = 2,
+        maxsize: int = 1000,
+        maxfiles: int = 10000,
+    ):
+        self.session = ClientSession()
+        self.directory = Path(directory)
+        self.maxsize = maxsize
+        self.maxfiles = maxfiles
+        # PIL releases the GIL while resizing and encoding, so threads are enough
+        self.executor = ThreadPoolExecutor(
+            max_workers=threads, thread_name_prefix="collage"
+        )
+        self.local = threading.local()
+        self.font_data: Optional[bytes] = None
+        # image url -> 250x250 JPEG thumbnail
+        self.memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self.files: "OrderedDict[str, None]" = OrderedDict()
+        self.inflight: Dict[str, asyncio.Task] = {}
+
+    async def run(self: "CollageRenderer", func, *args) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor, func, *args
+        )
+
+    def _scan(self: "CollageRenderer") -> List[str]:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        return [
+            path.name
+            for path in sorted(
+                self.directory.glob("*.jpg"), key=lambda p: p.stat().st_mtime
+            )
+        ]
+
+    async def load(self: "CollageRenderer"):
+        self.files = OrderedDict.fromkeys(await self.run(self._scan))
+
+        font = self.directory.parent / "Arial.ttf"
+        if font.exists():
+            self.font_data = await self.run(font.read_bytes)
+            return
+
+        try:
+            async with Session() as session:
+                r = await session.get(FONT_URL)
+                r.raise_for_status()
+                data = await r.read()
+
+            # an error page saved as the font would break every collage after it
+            await self.run(ImageFont.truetype, BytesIO(data), 20)
+            await self.run(font.write_bytes, data)
+            self.font_data = data
+        except Exception:
+            logger.warning("Unable to download the collage font, using the default")
+
+    @property
+    def font(self: "CollageRenderer") -> ImageFont.ImageFont:
+        # FreeType faces aren't shared across threads, each pool thread gets its own
+        if not (font := getattr(self.local, "font", None)):
+            try:
+                font = ImageFont.truetype(BytesIO(self.font_data), 20)
+            except OSError:
+                font = ImageFont.load_default()
+
+            self.local.font = font
+
+        return font
+
+    @staticmethod
+    def key(url: str) -> str:
+        return f"{hashlib.sha1(url.encode()).hexdigest()}.jpg"
+
+    def remember(self: "CollageRenderer", url: str, data: bytes):
+        self.memory[url] = data
+        self.memory.move_to_end(url)
+
+        while len(self.memory) > self.maxsize:
+            self.memory.popitem(last=False)
+
+    def _read(self: "CollageRenderer", name: str) -> Optional[bytes]:
+        path = self.directory / name
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+            return data
+        except OSError:
+            return None
+
+    def _shrink(
+        self: "CollageRenderer", raw: bytes, name: str, evicted: List[str]
+    ) -> bytes:
+        image = Image.open(BytesIO(raw)).convert("RGB").resize((TILE, TILE))
+        buffer = BytesIO()
+        image.save(buffer, format="jpeg", quality=90)
+        data = buffer.getvalue()
+
+        (self.directory / name).write_bytes(data)
+        for stale in evicted:
+            (self.directory / stale).unlink(missing_ok=True)
+
+        return data
+
+    async def thumbnail(self: "CollageRenderer", url: Optional[str]) -> Optional[bytes]:
+        if not url:
+            return None
+
+        if data := self.memory.get(url):
+            self.memory.move_to_end(url)
+            return data
+
+        if not (task := self.inflight.get(url)):
+            task = self.inflight[url] = asyncio.create_task(self.fetch(url))
+
+        return await asyncio.shield(task)
+
+    async def fetch(self: "CollageRenderer", url: str) -> Optional[bytes]:
+        name = self.key(url)
+
+        try:
+            if name in self.files:
+                self.files.move_to_end(name)
+                if data := await self.run(self._read, name):
+                    self.remember(url, data)
+                    return data
+
+            raw = await self.session.request("GET", url)
+            if not isinstance(raw, bytes):
+                return None
+
+            self.files[name] = None
+            evicted = []
+            while len(self.files) > self.maxfiles:
+                evicted.append(self.files.popitem(last=False)[0])
+
+            data = await self.run(self._shrink, raw, name, evicted)
+            self.remember(url, data)
+            return data
+        except Exception:
+            self.files.pop(name, None)
+            return None
+        finally:
+            self.inflight.pop(url, None)
+
+    def _compose(
+        self: "CollageRenderer",
+        columns: int,
+        rows: int,
+        tiles: List[Tuple[Optional[bytes], Any, str]],
+    ) -> BytesIO:
+        grid = Image.new("RGB", (columns * TILE, rows * TILE))
+
+        for i, (thumbnail, plays, name) in enumerate(tiles):
+            tile = (
+                Image.open(BytesIO(thumbnail))
+                if thumbnail
+                else Image.new("RGB", (TILE, TILE))
+            )
+            ImageDraw.Draw(tile).text(
+                (5, 200),
+                f"{plays} Plays\n{name}",
+                fill="white",
+                font=self.font,
+                stroke_width=1,
+                stroke_fill=0,
+            )
+            grid.paste(tile, ((i % columns) * TILE, (i // columns) * TILE))
+
+        buffer = BytesIO()
+        grid.save(buffer, format="png")
+        buffer.seek(0)
+        return buffer
+
+    async def render(
+        self: "CollageRenderer",
+        columns: int,
+        rows: int,
+        tiles: List[Tuple[Optional[str], Any, str]],
+    ) -> BytesIO:
+        thumbnails = await asyncio.gather(*(self.thumbnail(url) for url, *_ in tiles))
+        return await self.run(
+            self._compose,
+            columns,
+            rows,
+            [(thumbnail, *tile[1:]) for thumbnail, tile in zip(thumbnails, tiles)],
+        )
+
+    async def close(self: "CollageRenderer"):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        await self.session.close()
@@ -1,24 +1,40 @@
 import re
-import asyncio
+import string
 import datetime
 from contextlib import suppress
-from typing import Any, Optional, Union
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, Union
 
 import discord
 from discord.ext import commands
-from munch import Munch
-from pydantic import BaseModel
 
+PARAMS_REGEX = re.compile(r"\{([^{}]+?):\s*((?:[^{}]|(?:\{[^{}]*?\}))+)\}")
+URL_REGEX = re.compile(
+    r"(http|ftp|https):\/\/([\w_-]+(?:(?:\.[\w_-]+)+))([\w.,@?^=%&:\/~+#-]*[\w@?^=%&\/~+#-])"
+)
 
-class User(BaseModel):
-    mention: str
-    id: int
-    name: str
-    discriminator: str
-    created_at: Any
-    joined_at: Any
-    avatar: str
-    global_name: str
+
+class User:
+    __slots__ = (
+        "mention",
+        "id",
+        "name",
+        "discriminator",
+        "created_at",
+        "joined_at",
+        "avatar",
+        "global_name",
+    )
+
+    def __init__(self, member: Union[discord.Member, discord.User]):
+        self.mention = member.mention
+        self.id = member.id
+        self.name = member.name
+        self.discriminator = member.discriminator
+        self.created_at = member.created_at
+        self.joined_at = getattr(member, "joined_at", None)
+        self.avatar = member.display_avatar.url
+        self.global_name = member.global_name or member.name
 
     def __str__(self):
         return (
@@ -28,22 +44,158 @@ class User(BaseModel):
         )
 
 
-class Guild(BaseModel):
-    name: str
-    id: int
-    icon: Optional[str]
-    banner: Optional[str]
-    created_at: Any
-    owner: User
-    member_count: int
-    description: Optional[str]
-    boost_level: int
-    boosts: int
+class Guild:
+    __slots__ = (
+        "name",
+        "id",
+        "icon",
+        "banner",
+        "created_at",
+        "member_count",
+        "description",
+        "boost_level",
+        "boosts",
+        "owner",
+    )
+
+    def __init__(self, guild: discord.Guild):
+        self.name = guild.name
+        self.id = guild.id
+        self.icon = str(guild.icon)
+        self.banner = str(guild.banner)
+        self.created_at = guild.created_at
+        self.member_count = guild.member_count
+        self.description = guild.description
+        self.boost_level = guild.premium_tier
+        self.boosts = guild.premium_subscription_count
+        self.owner = User(guild.owner) if guild.owner else None
 
     def __str__(self):
         return self.name
 
 
+# the variables exposed to scripts, as listed by the variables command
+VARIABLES = {
+    "guild": Guild.__slots__ + tuple(f"owner.{name}" for name in User.__slots__),
+    "user": User.__slots__,
+}
+
+
+class ScriptFormatter(string.Formatter):
+    # scripts are user input, so only the listed variables may be reached
+    def get_field(self, field_name: str, args, kwargs) -> Tuple[Any, str]:
+        if "[" in field_name:
+            raise KeyError(field_name)
+
+        name, *attributes = field_name.split(".")
+        if name not in kwargs:
+            raise KeyError(name)
+
+        if name in VARIABLES:
+            if attributes and ".".join(attributes) not in VARIABLES[name]:
+                raise AttributeError(field_name)
+        elif any(not attr or attr.startswith("_") for attr in attributes):
+            raise AttributeError(field_name)
+
+        obj = kwargs[name]
+        for attribute in attributes:
+            obj = getattr(obj, attribute)
+
+        return obj, name
+
+
+formatter = ScriptFormatter()
+
+
+@lru_cache(maxsize=4096)
+def parse_script(
+    value: str,
+) -> Tuple[Tuple[str, Optional[str], Optional[str], Optional[str]], ...]:
+    return tuple(formatter.parse(value))
+
+
+def render_script(value: str, models: Dict[str, Any]) -> str:
+    parts = []
+
+    for literal, field, spec, conversion in parse_script(value):
+        parts.append(literal)
+
+        if field is not None:
+            obj, _ = formatter.get_field(field, (), models)
+            parts.append(
+                formatter.format_field(
+                    formatter.convert_field(obj, conversion),
+                    render_script(spec, models) if spec else "",
+                )
+            )
+
+    return "".join(parts)
+
+
+def split(value: str, length: int) -> Tuple[str, ...]:
+    values = value.split(" && ")
+    return tuple(values[:length]) + ("",) * (length - len(values))
+
+
+def resolve_button(*values: str) -> Tuple[Optional[str], Optional[str]]:
+    url = emoji = None
+
+    for value in values:
+        if value:
+            if URL_REGEX.match(value):
+                url = value
+            else:
+                emoji = value
+
+    return url, emoji
+
+
+@lru_cache(maxsize=1024)
+def compile_script(text: str) -> Union[str, Tuple[Tuple[str, Any], ...]]:
+    params = PARAMS_REGEX.findall(text)
+
+    if not params:
+        return text
+
+    nodes = []
+    for key, value in params:
+        match key:
+            case "title" | "description" | "thumbnail" | "image" | "content":
+                nodes.append((key, value))
+            case "timestamp":
+                if value in ("now", "joined_at", "created_at"):
+                    nodes.append((key, value))
+            case "color":
+                try:
+                    nodes.append((key, int(value[1:], 16)))
+                except ValueError:
+                    nodes.append((key, int("2f3136", 16)))
+            case "author":
+                nodes.append((key, split(value, 3)))
+            case "footer":
+                nodes.append((key, split(value, 2)))
+            case "field":
+                values = value.split(" && ")
+                if len(values) > 1:
+                    nodes.append(
+                        (
+                            key,
+                            (
+                                values[0],
+                                values[1],
+                                len(values) > 2 and values[2].lower() == "true",
+                            ),
+                        )
+                    )
+            case "delete":
+                with suppress(ValueError):
+                    nodes.append((key, int(value)))
+            case "button":
+                nodes.append((key, split(value, 3)))
+
+    return tuple(nodes)
+
+
 class Script(commands.Converter):
     async def convert(self, ctx: commands.Context, argument: str):
         x = await ctx.bot.embed.convert(ctx.author, argument)
@@ -51,57 +203,20 @@ class Script(commands.Converter):
 
 
 class Embed:
-    def init_models(self: "Embed", member: discord.Member):
-
-        o = member.guild.owner
-
-        user = User(
-            mention=member.mention,
-            id=member.id,
-            name=member.name,
-            discriminator=member.discriminator,
-            created_at=member.created_at,
-            joined_at=member.joined_at,
-            avatar=member.display_avatar.url,
-            global_name=member.global_name or member.name,
-        )
+    def init_models(self: "Embed", member: discord.Member) -> Dict[str, Any]:
+        return {"guild": Guild(member.guild), "user": User(member)}
 
-        owner = User(
-            mention=o.mention,
-            id=o.id,
-            name=o.name,
-            discriminator=o.discriminator,
-            created_at=o.created_at,
-            joined_at=o.joined_at,
-            avatar=o.display_avatar.url,
-            global_name=o.global_name or o.name,
-        )
+    def render_button(self, values: Tuple[str, str, str], models: dict):
+        label, obj, obj2 = (render_script(value, models) for value in values)
+        url, emoji = resolve_button(obj, obj2)
 
-        guild = Guild(
-            name=member.guild.name,
-            id=member.guild.id,
-            icon=str(member.guild.icon),
-            banner=str(member.guild.banner),
-            created_at=member.guild.created_at,
-            owner=owner,
-            member_count=member.guild.member_count,
-            description=member.guild.description,
-            boosts=member.guild.premium_subscription_count,
-            boost_level=member.guild.premium_tier,
+        return discord.ui.Button(
+            label=label,
+            url=url,
+            disabled=not url,
+            emoji=discord.PartialEmoji.from_str(emoji) if emoji else None,
         )
 
-        return {"guild": guild, "user": user}
-
-    def get_params(self, text: str) -> Union[tuple, str]:
-        results = re.findall(r"\{([^{}]+?):\s*((?:[^{}]|(?:\{[^{}]*?\}))+)\}", text)
-        return results or text
-
-    def find(self, l: list, index: int) -> Optional[Any]:
-        try:
-            return l[index]
-        except IndexError:
-            return ""
-
     async def convert(
         self,
         member: Union[discord.Member, discord.User],
@@ -120,22 +235,17 @@ class Embed:
         view = discord.ui.View()
         dict_embed = {"fields": []}
 
-        params = self.get_params(text)
+        nodes = compile_script(text)
 
-        if isinstance(params, str):
-            return {"content": params.format(**Munch(**models))}
+        if isinstance(nodes, str):
+            return {"content": render_script(nodes, models)}
 
-        for key, value in params:
-            await asyncio.sleep(0.01)
+        for key, value in nodes:
             match key:
-                case "title":
-                    dict_embed["title"] = value.format(**Munch(**models))
-                case "description":
-                    dict_embed["description"] = value.format(**Munch(**models))
-                case "thumbnail":
-                    dict_embed["thumbnail"] = {"url": value.format(**Munch(**models))}
-                case "image":
-                    dict_embed["image"] = {"url": value.format(**Munch(**models))}
+                case "title" | "description":
+                    dict_embed[key] = render_script(value, models)
+                case "thumbnail" | "image":
+                    dict_embed[key] = {"url": render_script(value, models)}
                 case "timestamp":
                     match value:
                         case "now":
@@ -147,72 +257,36 @@ class Embed:
                         case "created_at":
                             dict_embed["timestamp"] = member.created_at.isoformat()
                 case "color":
-                    try:
-                        dict_embed["color"] = int(value[1:], 16)
-                    except ValueError:
-                        dict_embed["color"] = int("2f3136", 16)
+                    dict_embed["color"] = value
                 case "content":
-                    content = value.format(**Munch(**models))
+                    content = render_script(value, models)
                 case "author":
-                    values = value.split(" && ")
+                    name, icon_url, url = value
                     dict_embed["author"] = {
-                        "name": values[0].format(**Munch(**models)),
-                        "icon_url": self.find(values, 1).format(**Munch(**models)),
-                        "url": self.find(values, 2).format(**Munch(**models)),
+                        "name": render_script(name, models),
+                        "icon_url": render_script(icon_url, models),
+                        "url": render_script(url, models),
                     }
                 case "footer":
-                    values = value.split(" && ")
+                    footer, icon_url = value
                     dict_embed["footer"] = {
-                        "text": values[0].format(**Munch(**models)),
-                        "icon_url": self.find(values, 1).format(**Munch(**models)),
+                        "text": render_script(footer, models),
+                        "icon_url": render_script(icon_url, models),
                     }
                 case "field":
-                    values = value.split(" && ")
-                    with suppress(IndexError):
-                        dict_embed["fields"].append(
-                            {
-                                "name": values[0].format(**Munch(**models)),
-                                "value": values[1].format(**Munch(**models)),
-                                "inline": str(self.find(values, 2)).lower() == "true",
-                            }
-                        )
+                    name, field_value, inline = value
+                    dict_embed["fields"].append(
+                        {
+                            "name": render_script(name, models),
+                            "value": render_script(field_value, models),
+                            "inline": inline,
+                        }
+                    )
                 case "delete":
-                    with suppress(ValueError):
-                        delete_after = int(value)
+                    delete_after = value
                 case "button":
                     with suppress(Exception):
-                        values = value.split(" && ")
-                        label = values[0].format(**Munch(**models))
-                        obj = self.find(values, 1).format(**Munch(**models))
-                        obj2 = self.find(values, 2).format(**Munch(**models))
-                        
-                        url = None 
-                        emoji = None
-
-                        url_regex = re.compile(r"(http|ftp|https):\/\/([\w_-]+(?:(?:\.[\w_-]+)+))([\w.,@?^=%&:\/~+#-]*[\w@?^=%&\/~+#-])")
-                        
-                        if obj:
-                            if url_regex.match(obj):
-                                url = obj
-                            else:
-                                emoji = discord.PartialEmoji.from_str(obj)
-
-                        if obj2: 
-                            if url_regex.match(obj2):
-                                url = obj2
-                            else:
-                                emoji = discord.PartialEmoji.from_str(obj2) 
-
-                        view.add_item(
-                            discord.ui.Button(
-                                label=label,
-                                url=url,
-                                disabled=not url,
-                                emoji=emoji
-                            )
-                        )
-                case _:
-                    continue
+                        view.add_item(self.render_button(value, models))
 
         if len(dict_embed.keys()) > 1:
             embed = discord.Embed.from_dict(dict_embed)
@@ -1,34 +1,85 @@
 import asyncio
 from io import BytesIO
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple
 
-from aiohttp import ClientSession as Session
+from aiohttp import ClientError
+from asyncpg import Pool
 from munch import Munch
-from PIL import Image, ImageDraw, ImageFont
 
 from structure.config import API
-from structure.managers import ClientSession, Record
+from structure.managers import Cache, ClientSession, Record
 
+from .collage import CollageRenderer
 from .models import *
 
+# seconds a response stays fresh for each method
+TTLS: Dict[str, int] = {
+    "user.getrecenttracks": 10,
+    "user.getinfo": 300,
+    "user.gettoptracks": 600,
+    "user.gettopartists": 600,
+    "user.gettopalbums": 600,
+    "user.gettoptags": 600,
+    "artist.getinfo": 21600,
+    "album.getinfo": 21600,
+    "track.getinfo": 21600,
+}
+# metadata calls made on behalf of a user carry that user's play count
+PLAYCOUNT_TTL = 60
+
 
 class FMHandler(ClientSession):
-    def __init__(self: "FMHandler"):
+    def __init__(self: "FMHandler", db: Pool):
         super().__init__(base_url="https://ws.audioscrobbler.com/2.0/")
+        self.db = db
+        self.renderer = CollageRenderer()
+        # keyed by method first, so each method is its own LRU namespace
+        self.cache = Cache(maxsize=2000)
+        self.inflight: Dict[str, asyncio.Task] = {}
+
+    @staticmethod
+    def ttl(p: Dict[str, Any]) -> int:
+        method: str = p["method"]
+        if "username" in p and not method.startswith("user."):
+            return min(TTLS.get(method, PLAYCOUNT_TTL), PLAYCOUNT_TTL)
+
+        return TTLS.get(method, PLAYCOUNT_TTL)
 
     async def request(self: "FMHandler", **p) -> Munch:
+        key = f"{p['method']}-" + "&".join(
+            f"{k}={v}" for k, v in sorted(p.items()) if k != "method"
+        )
+
+        if (data := self.cache.get(key)) is not None:
+            return data
+
+        # identical requests made while one is in flight share its response
+        if not (task := self.inflight.get(key)):
+            task = self.inflight[key] = asyncio.create_task(self.fetch(key, **p))
+
+        return await asyncio.shield(task)
+
+    async def fetch(self: "FMHandler", key: str, **p) -> Munch:
+        ttl = self.ttl(p)
         slug = p.pop("slug", None)
 
-        data: Munch = await super().request(
-            "GET",
-            self.base_url,
-            params={
-                "api_key": API.lastfm,
-                "format": "json",
-                **p,
-            },
-            slug=slug,
-        )
+        try:
+            data: Munch = await super().request(
+                "GET",
+                self.base_url,
+                params={
+                    "api_key": API.lastfm,
+                    "format": "json",
+                    **p,
+                },
+                slug=slug,
+            )
+        finally:
+            self.inflight.pop(key, None)
+
+        if data is not None:
+            await self.cache.add(key, data, ttl)
+
         return data
 
     async def profile(
@@ -167,33 +218,13 @@ class FMHandler(ClientSession):
             user=await self.profile(username),
         )
 
-    async def read_image(
-        self: "FMHandler", url: str, plays: int, artist: str, font
-    ) -> Image:
+    async def image_url(self: "FMHandler", artist: str) -> Optional[str]:
         try:
-            r = await super().request("GET", url)
-            img = Image.open(BytesIO(r)).convert("RGB").resize((250, 250))
-        except:
-            img = Image.new("RGB", (250, 250))
-        finally:
-            draw = ImageDraw.Draw(img)
-            draw.text(
-                (5, 200),
-                f"{plays} Plays\n{artist}",
-                fill="white",
-                font=font,
-                stroke_width=1,
-                stroke_fill=0,
-            )
-            return img
-
-    async def get_image(self, artist: str, username: str, plays: int, font) -> Image:
-        data = await self.request(
-            method="artist.getinfo", artist=artist, username=username, slug="artist"
-        )
+            data = await self.request(method="artist.getinfo", artist=artist, slug="artist")
+        except (ClientError, asyncio.TimeoutError):
+            return None
 
-        image_url = data["image"][-1]["#text"]
-        return await self.read_image(image_url, plays, artist, font)
+        return data["image"][-1]["#text"] if data and data.image else None
 
     async def artist_collage(
         self: "FMHandler", username: str, size: str, period: str
@@ -206,60 +237,126 @@ class FMHandler(ClientSession):
         if not top_artists:
             return None
 
-        # creating the font
-        session = Session()
-        r = await session.get(
-            "https://github.com/matomo-org/travis-scripts/raw/master/fonts/Arial.ttf"
-        )
-        font_read = await r.read()
-        font = ImageFont.truetype(BytesIO(font_read), 20)
-        await session.close()
-
-        # getting the images
-        tasks = await asyncio.gather(
-            *[
-                self.get_image(r.artist.name, username, r.artist.plays, font)
-                for r in top_artists
-                if getattr(r.artist, "plays", 0) > 0
-            ]
+        artists = [r.artist for r in top_artists if getattr(r.artist, "plays", 0) > 0]
+        urls = await asyncio.gather(*(self.image_url(r.name) for r in artists))
+
+        return await self.renderer.render(
+            a, b, [(url, r.plays, r.name) for url, r in zip(urls, artists)]
         )
 
-        w, h = (250, 250)
-        grid = Image.new("RGB", (a * w, b * h))
+    async def whoknows(
+        self: "FMHandler",
+        artist: str,
+        results: List[Record],
+        concurrency: int = 10,
+        fresh: int = 1800,
+    ) -> Tuple[List[ArtistInfo], bool]:
+        key = artist.lower()
+        indexed: Dict[str, Record] = {
+            record.username: record
+            for record in await self.db.fetch(
+                """
+                SELECT username, name, url, plays,
+                updated_at > NOW() - $3::INT * INTERVAL '1 second' AS fresh
+                FROM lastfm.plays WHERE artist = $1
+                AND username = ANY($2::TEXT[])
+                """,
+                key,
+                [result.username for result in results],
+                fresh,
+            )
+        }
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def refresh(username: str) -> Optional[Tuple[str, str, str, str, int]]:
+            async with semaphore:
+                try:
+                    data = await self.request(
+                        method="artist.getinfo",
+                        artist=artist,
+                        username=username,
+                        slug="artist",
+                    )
+                except (ClientError, asyncio.TimeoutError):
+                    return None
+
+            if not data or not data.name:
+                return None
+
+            return (
+                username,
+                key,
+                data.name,
+                data.url,
+                int(getattr(data.stats, "userplaycount", None) or 0),
+            )
 
-        # pasting each artist image on the collage
-        for i, image in enumerate(tasks):
-            grid.paste(image, ((i % a) * w, (i // a) * h))
+        # only accounts without a fresh index entry go to Last.fm
+        stale = list(
+            {
+                result.username
+                for result in results
+                if result.username not in indexed
+                or not indexed[result.username].fresh
+            }
+        )
+        rows = await asyncio.gather(*map(refresh, stale))
+        refreshed = [row for row in rows if row]
+        # Last.fm errors (429s included) come back empty, an account that failed
+        # without an indexed count leaves the listing incomplete
+        complete = all(
+            row or username in indexed for username, row in zip(stale, rows)
+        )
 
-        buffer = BytesIO()
-        grid.save(buffer, format="png")
-        buffer.seek(0)
-        return buffer
+        if refreshed:
+            await self.db.executemany(
+                """
+                INSERT INTO lastfm.plays (username, artist, name, url, plays)
+                VALUES ($1, $2, $3, $4, $5)
+                ON CONFLICT (username, artist) DO UPDATE SET
+                name = $3, url = $4, plays = $5, updated_at = NOW()
+                """,
+                refreshed,
+            )
 
-    async def whoknows(
-        self: "FMHandler", artist: str, results: List[Record]
-    ) -> List[ArtistInfo]:
+        # stale entries whose refresh failed still answer with their last count
+        counts = {r.username: (r.name, r.url, r.plays) for r in indexed.values()}
+        counts.update({row[0]: row[2:] for row in refreshed})
         plays: List[ArtistInfo] = []
 
         for result in results:
-            artist_info = await self.request(
-                method="artist.getinfo",
-                artist=artist,
-                username=result.username,
-                slug="artist",
-            )
+            if not (entry := counts.get(result.username)):
+                continue
 
-            if int(artist_info.stats.userplaycount) > 0:
+            name, url, count = entry
+            if count > 0:
                 plays.append(
                     ArtistInfo(
-                        name=artist_info.name,
-                        url=artist_info.url,
-                        plays=artist_info.stats.userplaycount,
-                        **result,
+                        name=name,
+                        url=url,
+                        plays=count,
+                        user_id=result.user_id,
+                        username=result.username,
                     )
                 )
 
-        return sorted(plays, key=lambda b: b.plays, reverse=True)
+        return sorted(plays, key=lambda b: b.plays, reverse=True), complete
+
+    async def crown(self: "FMHandler", artist: str, whoknows: List[ArtistInfo]) -> bool:
+        if not whoknows:
+            return False
+
+        # only reports a claim when the crown actually changes hands
+        r = await self.db.execute(
+            """
+            INSERT INTO lastfm.crowns VALUES ($1,$2)
+            ON CONFLICT (artist) DO UPDATE SET
+            user_id = $2 WHERE crowns.user_id != $2
+            """,
+            artist.lower(),
+            whoknows[0].user_id,
+        )
+        return r.endswith("1")
 
     async def top(
         self: "FMHandler",
@@ -1,4 +1,3 @@
-import json
 from io import BytesIO
 from typing import Any, List, Optional, Union
 
@@ -41,27 +40,22 @@ class VoiceMasterView(discord.ui.View):
             )
             return False
 
-        results = await interaction.client.db.fetchval(
-            "SELECT voice_channels FROM voicemaster WHERE guild_id = $1",
-            interaction.guild.id,
-        )
+        registry = interaction.client.voicemaster
 
-        if not results:
+        if interaction.guild.id not in registry.join:
             await interaction.response.send_message(
                 "The voicemaster feature is not configured in this server",
                 ephemeral=True,
             )
             return False
 
-        voice_channels: dict = json.loads(results)
-
-        if not str(channel.id) in voice_channels.keys():
+        if not (owner_id := registry.owner(channel.id)):
             await interaction.response.send_message(
                 "You are **not** in a voice channel created by me", ephemeral=True
             )
             return False
 
-        if voice_channels[str(channel.id)] != interaction.user.id:
+        if owner_id != interaction.user.id:
             await interaction.response.send_message(
                 "You do **not** own this voice channel", ephemeral=True
             )